@@ -0,0 +1,38 @@
+import argparse
+import json
+import sys
+
+from benchmarks.suite import SCRIPTS, WIDGETS, runSuite
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description='Time the listen and draw phases of every widget without a display'
+    )
+    parser.add_argument('--widgets', nargs='+', choices=list(WIDGETS), help='widgets to run (default: all)')
+    parser.add_argument('--counts', nargs='+', type=int, default=[1, 10, 100], help='numbers of widgets')
+    parser.add_argument('--scripts', nargs='+', choices=SCRIPTS, default=list(SCRIPTS), help='input scripts')
+    parser.add_argument('--frames', type=int, default=100, help='timed frames per case')
+    parser.add_argument('--output', help='file to write the JSON results to (default: stdout)')
+    args = parser.parse_args()
+
+    def progress(result):
+        print(
+            f'{result["widget"]:>12} x{result["count"]:<5} {result["script"]:>5}: '
+            f'listen {result["listen"]["meanMs"]:8.3f}ms, draw {result["draw"]["meanMs"]:8.3f}ms',
+            file=sys.stderr
+        )
+
+    results = runSuite(args.widgets, args.counts, args.scripts, args.frames, progress)
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+import random
+import string
+import time
+
+from pygame_widgets.combobox import ComboBox
+from pygame_widgets.search import SearchIndex
+
+random.seed(0)
+
+MAX_RESULTS = 10
+QUERIES = ['m', 'ma', 'man', 'mang', 'mango', 'ngo', 'xq', 'xqz']
+
+# Self-check of cases the timings do not cover
+assert SearchIndex([], MAX_RESULTS).search('') == []
+assert SearchIndex([], MAX_RESULTS).search('a') == []
+edited = ['apple', 'banana']
+index = SearchIndex(edited, MAX_RESULTS)
+assert index.search('ch', edited) == []
+edited.append('cherry')
+assert index.search('ch', edited) == ['cherry']
+edited[0] = 'chestnut'
+assert index.search('ch', edited) == ['chestnut', 'cherry']
+
+for size in (1_000, 100_000, 1_000_000):
+    choices = [
+        ''.join(random.choice(string.ascii_lowercase) for _ in range(random.randint(4, 14)))
+        for _ in range(size)
+    ]
+
+    start = time.perf_counter()
+    index = SearchIndex(choices, MAX_RESULTS)
+    built = time.perf_counter() - start
+
+    # The default search is quadratic in the number of prefix matches, so is only timed on smaller lists
+    linear = float('nan')
+    if size <= 100_000:
+        start = time.perf_counter()
+        for query in QUERIES:
+            ComboBox._defaultSearch(query, choices)[:MAX_RESULTS]
+        linear = (time.perf_counter() - start) / len(QUERIES)
+
+    # The choices are passed as ComboBox does, so each search also checks that they have not been edited
+    start = time.perf_counter()
+    for query in QUERIES:
+        index.search(query, choices)
+    indexed = (time.perf_counter() - start) / len(QUERIES)
+
+    print(f'{size} choices: index built in {built:.2f}s, '
+          f'{linear * 1000:.2f}ms per keystroke linear, {indexed * 1000:.3f}ms indexed')
@@ -0,0 +1,59 @@
+import os
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+
+from pygame_widgets.button import Button
+from pygame_widgets.dropdown import Dropdown
+from pygame_widgets.font import FontRegistry
+from pygame_widgets.selection import Checkbox
+from pygame_widgets.textbox import TextBox
+from pygame_widgets.widget import WidgetHandler
+
+CHOICES = [f'Choice {i}' for i in range(500)]
+
+# Functions creating the widgets of each case
+CASES = {
+    '1000 Buttons': lambda: [Button(win, 0, 0, 100, 50, text=str(i)) for i in range(1000)],
+    '1000 TextBoxes': lambda: [TextBox(win, 0, 0, 100, 50) for _ in range(1000)],
+    '1000 Checkboxes': lambda: [Checkbox(win, 0, 0, 100, 50, ('a', 'b')) for _ in range(1000)],
+    'Dropdown with 500 choices': lambda: [Dropdown(win, 0, 0, 100, 50, 'Dropdown', CHOICES)],
+}
+
+
+def measure(factory, shared):
+    """ Time a factory
+
+    :param factory: Function creating the widgets
+    :param shared: Whether to use the FontRegistry, otherwise every widget loads its own font as it did before
+    :return: The time in milliseconds
+    """
+    FontRegistry.clear()
+    getFont = FontRegistry.__dict__['getFont']
+    if not shared:
+        FontRegistry.getFont = pygame.font.SysFont
+
+    try:
+        start = time.perf_counter()
+        widgets = factory()
+        elapsed = time.perf_counter() - start
+    finally:
+        FontRegistry.getFont = getFont
+
+    for widget in widgets:
+        WidgetHandler.removeWidget(widget)
+    return elapsed * 1000
+
+
+if __name__ == '__main__':
+    pygame.init()
+    win = pygame.display.set_mode((100, 100))
+
+    for name, factory in CASES.items():
+        unshared = measure(factory, False)
+        shared = measure(factory, True)
+        print(f'{name:>26}: {unshared:8.1f}ms with a font each, {shared:8.1f}ms with shared fonts '
+              f'({unshared / shared:.1f}x)')
@@ -0,0 +1,82 @@
+import os
+import subprocess
+import sys
+
+# Milliseconds each module may take to import on top of pygame itself. Each takes under 10ms on a desktop, so this
+# leaves headroom for slow machines
+BUDGETS = {
+    'pygame_widgets': 50,
+    'pygame_widgets.animations': 50,
+    'pygame_widgets.button': 50,
+    'pygame_widgets.combobox': 50,
+    'pygame_widgets.dropdown': 50,
+    'pygame_widgets.exceptions': 50,
+    'pygame_widgets.font': 50,
+    'pygame_widgets.layer': 50,
+    'pygame_widgets.mouse': 50,
+    'pygame_widgets.popup': 50,
+    'pygame_widgets.profiler': 50,
+    'pygame_widgets.progressbar': 50,
+    'pygame_widgets.search': 50,
+    'pygame_widgets.selection': 50,
+    'pygame_widgets.slider': 50,
+    'pygame_widgets.spatial': 50,
+    'pygame_widgets.textbox': 50,
+    'pygame_widgets.toggle': 50,
+    'pygame_widgets.util': 50,
+    'pygame_widgets.widget': 50,
+}
+
+# Heavy modules that no widget should import until it is used
+LAZY_MODULES = ('tkinter',)
+
+SCRIPT = '''
+import sys
+import time
+import pygame
+
+start = time.perf_counter()
+import {module}
+print((time.perf_counter() - start) * 1000)
+print(','.join(name for name in {lazy} if name in sys.modules))
+'''
+
+
+def measure(module, repeats=5):
+    """ Import a module in new interpreters
+
+    :return: The fastest import time in milliseconds and the lazy modules that were imported
+    """
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT='1', SDL_VIDEODRIVER='dummy')
+    times = []
+    imported = []
+    for _ in range(repeats):
+        output = subprocess.run(
+            [sys.executable, '-c', SCRIPT.format(module=module, lazy=LAZY_MODULES)],
+            capture_output=True, text=True, check=True, env=env
+        ).stdout.splitlines()
+        times.append(float(output[0]))
+        imported = [name for name in output[1].split(',') if name]
+
+    return min(times), imported
+
+
+def main():
+    failed = False
+    for module, budget in BUDGETS.items():
+        milliseconds, imported = measure(module)
+        status = 'ok'
+        if milliseconds > budget:
+            status = f'over budget of {budget}ms'
+            failed = True
+        if imported:
+            status = f'imported {", ".join(imported)}'
+            failed = True
+
+        print(f'{module:>28}: {milliseconds:7.1f}ms {status}')
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
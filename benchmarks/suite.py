@@ -0,0 +1,223 @@
+import gc
+import math
+import os
+import platform
+import statistics
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')  # Keeps JSON written to stdout valid
+
+import pygame
+
+import pygame_widgets
+from pygame_widgets.button import Button, ButtonArray
+from pygame_widgets.combobox import ComboBox
+from pygame_widgets.dropdown import Dropdown
+from pygame_widgets.mouse import Mouse, MouseState
+from pygame_widgets.progressbar import ProgressBar
+from pygame_widgets.selection import Checkbox, Radio
+from pygame_widgets.slider import Slider
+from pygame_widgets.textbox import TextBox
+from pygame_widgets.toggle import Toggle
+
+CELL_WIDTH = 160
+CELL_HEIGHT = 120
+MARGIN = 10
+
+CHOICES = sorted(pygame.colordict.THECOLORS)[:50]
+
+# Factories taking (win, x, y, width, height, index), where the rectangle is the cell the widget should fit in
+WIDGETS = {
+    'Button': lambda win, x, y, w, h, i: Button(win, x, y, w, h, text=f'Button {i}'),
+    'ButtonArray': lambda win, x, y, w, h, i: ButtonArray(win, x, y, w, h, (2, 2), texts=('1', '2', '3', '4')),
+    'TextBox': lambda win, x, y, w, h, i: TextBox(win, x, y, w, h, fontSize=20),
+    'Slider': lambda win, x, y, w, h, i: Slider(win, x, y + h // 3, w, h // 3),
+    'Toggle': lambda win, x, y, w, h, i: Toggle(win, x, y + h // 4, w // 2, h // 2),
+    'Checkbox': lambda win, x, y, w, h, i: Checkbox(win, x, y, w, h, ('One', 'Two', 'Three')),
+    'Radio': lambda win, x, y, w, h, i: Radio(win, x, y, w, h, ('One', 'Two', 'Three')),
+    'Dropdown': lambda win, x, y, w, h, i: Dropdown(win, x, y, w, h // 5, f'Dropdown {i}', CHOICES[:4]),
+    'ComboBox': lambda win, x, y, w, h, i: ComboBox(win, x, y, w, h // 5, CHOICES, maxResults=4),
+    'ProgressBar': lambda win, x, y, w, h, i: ProgressBar(win, x, y + h // 3, w, h // 3, lambda: time.time() % 1),
+}
+
+SCRIPTS = ('idle', 'hover', 'click', 'type')
+
+TYPED = 'the quick brown fox jumps over the lazy dog '
+
+
+class ScriptedMouse:
+    """ Feeds a scripted mouse position and state to the widgets instead of the real mouse, which does not exist
+    under the dummy video driver
+    """
+
+    def __init__(self):
+        self.position = (0, 0)
+        self._getMousePos = None
+
+    def __enter__(self):
+        self._getMousePos = Mouse.getMousePos
+        Mouse.getMousePos = lambda: self.position
+        return self
+
+    def __exit__(self, *exc):
+        Mouse.getMousePos = self._getMousePos
+        Mouse._mouseState = MouseState.HOVER
+
+    def apply(self, position, state):
+        self.position = position
+        Mouse._mouseState = state
+
+
+def keyPress(char):
+    key = pygame.K_BACKSPACE if char == '\b' else ord(char)
+    unicode = '' if char == '\b' else char
+    return [
+        pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode=unicode, scancode=0),
+        pygame.event.Event(pygame.KEYUP, key=key, mod=0, unicode=unicode, scancode=0),
+    ]
+
+
+def getFrame(script, frame, targets):
+    """ The mouse position, mouse state and events of a frame of a script
+
+    :param script: One of SCRIPTS
+    :param frame: Index of the frame
+    :param targets: Centres of the widgets
+    :return: ((x, y), MouseState, [pygame.event.Event])
+    """
+    if script == 'idle':
+        return (-1, -1), MouseState.HOVER, []
+
+    if script == 'hover':
+        x, y = targets[frame % len(targets)]
+        motion = pygame.event.Event(pygame.MOUSEMOTION, pos=(x, y), rel=(0, 0), buttons=(0, 0, 0))
+        return (x, y), MouseState.HOVER, [motion]
+
+    if script == 'click':
+        # Move onto a widget, press, drag a little and release, then go on to the next widget
+        x, y = targets[frame // 4 % len(targets)]
+        phase = frame % 4
+        if phase == 0:
+            return (x, y), MouseState.HOVER, []
+        if phase == 1:
+            return (x, y), MouseState.CLICK, [pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(x, y), button=1)]
+        if phase == 2:
+            return (x + 5, y), MouseState.DRAG, []
+        return (x + 5, y), MouseState.RELEASE, [pygame.event.Event(pygame.MOUSEBUTTONUP, pos=(x + 5, y), button=1)]
+
+    if script == 'type':
+        # Select the first widget, then type into it, deleting a character every so often
+        x, y = targets[0]
+        if frame == 0:
+            return (x, y), MouseState.CLICK, []
+        if frame == 1:
+            return (x, y), MouseState.RELEASE, []
+
+        char = '\b' if frame % 10 == 0 else TYPED[frame % len(TYPED)]
+        return (x, y), MouseState.HOVER, keyPress(char)
+
+    raise ValueError(f'Unknown script {script!r}')
+
+
+def summarise(times):
+    """Summary statistics in milliseconds of times in nanoseconds"""
+    times = sorted(times)
+    return {
+        'meanMs': statistics.fmean(times) / 1e6,
+        'medianMs': statistics.median(times) / 1e6,
+        'p95Ms': times[min(len(times) - 1, int(len(times) * 0.95))] / 1e6,
+        'maxMs': times[-1] / 1e6,
+    }
+
+
+def runCase(widgetName, count, script, frames, warmup=10):
+    """ Time the listen and draw phases of each frame for a number of one kind of widget
+
+    :param widgetName: Key of WIDGETS
+    :param count: Number of widgets
+    :param script: One of SCRIPTS
+    :param frames: Number of timed frames
+    :param warmup: Number of untimed frames run first
+    :return: Results of the case
+    :rtype: dict
+    """
+    columns = math.ceil(math.sqrt(count))
+    rows = math.ceil(count / columns)
+    win = pygame.display.set_mode((columns * CELL_WIDTH, rows * CELL_HEIGHT))
+
+    factory = WIDGETS[widgetName]
+    widgets = []
+    targets = []
+    for i in range(count):
+        x = i % columns * CELL_WIDTH + MARGIN
+        y = i // columns * CELL_HEIGHT + MARGIN
+        widget = factory(win, x, y, CELL_WIDTH - 2 * MARGIN, CELL_HEIGHT - 2 * MARGIN, i)
+        widgets.append(widget)
+        targets.append((widget.getX() + widget.getWidth() // 2, widget.getY() + widget.getHeight() // 2))
+
+    listenTimes = []
+    drawTimes = []
+    with ScriptedMouse() as mouse:
+        for frame in range(warmup + frames):
+            position, state, events = getFrame(script, frame, targets)
+            mouse.apply(position, state)
+            win.fill((255, 255, 255))
+
+            start = time.perf_counter_ns()
+            for widget in widgets:
+                widget.listen(events)
+            listened = time.perf_counter_ns()
+            for widget in widgets:
+                widget.draw()
+            drawn = time.perf_counter_ns()
+
+            if frame >= warmup:
+                listenTimes.append(listened - start)
+                drawTimes.append(drawn - listened)
+
+    del widgets
+    gc.collect()
+
+    return {
+        'widget': widgetName,
+        'count': count,
+        'script': script,
+        'frames': frames,
+        'listen': summarise(listenTimes),
+        'draw': summarise(drawTimes),
+    }
+
+
+def runSuite(widgetNames=None, counts=(1, 10, 100), scripts=SCRIPTS, frames=100, progress=None):
+    """ Run every combination of widget, count and script
+
+    :param widgetNames: Keys of WIDGETS to run, or None for all of them
+    :param counts: Numbers of widgets
+    :param scripts: Scripts to run
+    :param frames: Number of timed frames per case
+    :param progress: Optional function called with the result of each case
+    :return: Machine information and the results of each case
+    :rtype: dict
+    """
+    pygame.init()
+
+    results = []
+    for widgetName in widgetNames or WIDGETS:
+        for count in counts:
+            for script in scripts:
+                result = runCase(widgetName, count, script, frames)
+                results.append(result)
+                if progress is not None:
+                    progress(result)
+
+    return {
+        'machine': {
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'pygameWidgets': pygame_widgets.__version__,
+            'platform': platform.platform(),
+            'videoDriver': os.environ['SDL_VIDEODRIVER'],
+        },
+        'results': results,
+    }
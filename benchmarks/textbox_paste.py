@@ -0,0 +1,29 @@
+import os
+import random
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+from pygame_widgets.textbox import TextBox
+
+# Set up Pygame without a display
+pygame.init()
+win = pygame.display.set_mode((800, 600))
+
+random.seed(0)
+
+for size in (50_000, 1_000_000):
+    # Random words with a newline roughly every 5000 characters, like a pasted log
+    text = ''.join(random.choice('abcdefghij    ') for _ in range(size))
+    text = '\n'.join(text[i:i + 5000] for i in range(0, size, 5000))
+
+    textbox = TextBox(win, 100, 100, 600, 400, fontSize=20)
+
+    start = time.perf_counter()
+    textbox.addText(text)
+    elapsed = time.perf_counter() - start
+
+    assert textbox.getText() == text
+    print(f'Pasted {size} characters into {len(textbox.text)} lines in {elapsed:.3f}s')
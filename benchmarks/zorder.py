@@ -0,0 +1,136 @@
+import os
+import random
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+
+from pygame_widgets.widget import OrderedWeakset, WidgetBase, ZOrder
+
+COUNT = 10000
+
+
+class Widget(WidgetBase):
+    def __init__(self, win):
+        super().__init__(win, 0, 0, 10, 10, isSubWidget=True)
+
+    def listen(self, events):
+        pass
+
+    def draw(self):
+        pass
+
+
+class Weakset:
+    """The z-order as the WidgetHandler kept it before, in an OrderedWeakset"""
+
+    def __init__(self, widgets):
+        self.widgets = OrderedWeakset(widgets)
+
+    def moveToTop(self, widget):
+        self.widgets.move_to_end(widget)
+
+    def moveToBottom(self, widget):
+        self.widgets.move_to_start(widget)
+
+    def moveAllToTop(self, widgets):
+        for widget in widgets:
+            self.widgets.move_to_end(widget)
+
+    def frame(self):
+        # As WidgetHandler.main took its copy of the widgets to listen in reverse and then draw
+        widgets = list(self.widgets)
+        return widgets[::-1], widgets
+
+
+class Cached:
+    def __init__(self, widgets):
+        self.widgets = ZOrder(widgets)
+
+    def moveToTop(self, widget):
+        self.widgets.moveToTop(widget)
+
+    def moveToBottom(self, widget):
+        self.widgets.moveToBottom(widget)
+
+    def moveAllToTop(self, widgets):
+        self.widgets.moveAllToTop(widgets)
+
+    def frame(self):
+        widgets = self.widgets.snapshot()
+        return reversed(widgets), widgets
+
+
+def frames(order, widgets, count=100):
+    for _ in range(count):
+        order.frame()
+
+
+def topmost(order, widgets, count=100):
+    # As a ComboBox moves its choices to the top every frame while they are shown
+    for _ in range(count):
+        order.moveToTop(widgets[-1])
+        order.frame()
+
+
+def showHide(order, widgets, count=100):
+    # A widget is shown or hidden between frames
+    chosen = random.Random(0).sample(widgets, count)
+    for i, widget in enumerate(chosen):
+        if i % 2:
+            order.moveToBottom(widget)
+        else:
+            order.moveToTop(widget)
+        order.frame()
+
+
+def moves(order, widgets, count=10000):
+    # Many widgets are shown or hidden in one frame
+    for widget in random.Random(0).choices(widgets, k=count):
+        order.moveToTop(widget)
+    order.frame()
+
+
+def batch(order, widgets, count=1000):
+    order.moveAllToTop(random.Random(0).sample(widgets, count))
+    order.frame()
+
+
+CASES = {
+    '100 frames': frames,
+    '100 frames moving the topmost widget to the top': topmost,
+    '100 frames showing or hiding a widget': showHide,
+    '10000 moves to the top then a frame': moves,
+    '1000 widgets moved to the top together then a frame': batch,
+}
+
+
+def measure(case, cls, widgets):
+    """ Time a case
+
+    :param case: Function performing the operations on the z-order
+    :param cls: The z-order to measure
+    :param widgets: Widgets held by the z-order
+    :return: The time in milliseconds
+    """
+    order = cls(widgets)
+    order.frame()
+
+    start = time.perf_counter()
+    case(order, widgets)
+    return (time.perf_counter() - start) * 1000
+
+
+if __name__ == '__main__':
+    pygame.init()
+    win = pygame.display.set_mode((100, 100))
+    widgets = [Widget(win) for _ in range(COUNT)]
+
+    print(f'{COUNT} widgets')
+    for name, case in CASES.items():
+        before = measure(case, Weakset, widgets)
+        after = measure(case, Cached, widgets)
+        print(f'{name:>52}: {before:8.1f}ms with an OrderedWeakset, {after:8.1f}ms with a ZOrder '
+              f'({before / after:.1f}x)')
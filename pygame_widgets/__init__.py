@@ -1,13 +1,15 @@
 from pygame_widgets.mouse import Mouse
 from pygame_widgets.widget import WidgetHandler
+from pygame_widgets.animations import AnimationHandler
 
 from pygame.event import Event
 
 __version__ = '1.3.2'
 
 def update(events: list[Event]):
-    Mouse.updateMouseState()
-    WidgetHandler.main(events)
+    Mouse.pump(events)
+    AnimationHandler.main()
+    return WidgetHandler.main(events)
 
 def version():
     print(f'PygameWidgets v{__version__}')
@@ -1 +1 @@
-from animation import Resize, Recolour, Translate
+from pygame_widgets.animations.animation import AnimationHandler, Resize, Recolour, Translate
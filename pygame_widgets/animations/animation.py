@@ -1,4 +1,3 @@
-from threading import Thread
 import time
 import pygame
 
@@ -18,11 +17,14 @@ class AnimationBase:
         self.timeout = timeout
         self.allowMultiple = allowMultiple
         self.params = kwargs
-        self.thread = Thread()
 
         self.started = False
         self.runOnce = False
 
+        self.startTime = 0
+        self.initialNumberParams = {}
+        self.initialTupleParams = {}
+
         self.checkValidParams()
 
     def checkValidParams(self):
@@ -39,45 +41,76 @@ class AnimationBase:
 
     def start(self):
         if not self.started and not (self.runOnce and not self.allowMultiple):
-            self.thread = Thread(target=self.loop)
-            self.thread.start()
+            self.started = self.runOnce = True
+            self.startTime = time.perf_counter()
 
-    def loop(self):
-        self.started = self.runOnce = True
+            self.initialNumberParams = {}
+            self.initialTupleParams = {}
+            for param, target in self.params.items():
+                initialValue = self.widget.get(param)
+                if isinstance(initialValue, (int, float)):
+                    self.initialNumberParams[param] = initialValue
+                elif isinstance(initialValue, (tuple, list)):
+                    self.initialTupleParams[param] = tuple(initialValue)
 
-        start = time.time()
+            AnimationHandler.addAnimation(self)
 
-        initialNumberParams = {}
-        initialTupleParams = {}
-        for param, target in self.params.items():
-            initialValue = self.widget.get(param)
-            if isinstance(initialValue, (int, float)):
-                initialNumberParams[param] = initialValue
-            elif isinstance(initialValue, (tuple, list)):
-                initialTupleParams[param] = tuple(initialValue)
-
-        # Animate
-        while time.time() - start < self.timeout:
-            step = (time.time() - start) / self.timeout
-
-            # Numeric animation
-            for param, initialValue in initialNumberParams.items():
-                target = self.params[param]
-                newValue = initialValue + step * (target - initialValue)
-                self.widget.set(param, newValue)
-
-            # Tuple animation
-            for param, initialTuple in initialTupleParams.items():
-                target = self.params[param]
-                newValue = tuple(
-                    initialTuple[i] + step * (target[i] - initialTuple[i]) for i in range(len(initialTuple)))
-                self.widget.set(param, newValue)
-
-        # Ensure value is exactly correct at end
-        for param, target in self.params.items():
-            self.widget.set(param, target)
+    def update(self, now):
+        """Advance the animation, called once per frame by AnimationHandler
 
-        self.started = False
+        :param now: The time of the current frame
+        :return: Whether the animation has finished
+        """
+        if now - self.startTime >= self.timeout:
+            # Ensure value is exactly correct at end
+            for param, target in self.params.items():
+                self.widget.set(param, target)
+
+            self.started = False
+            return True
+
+        step = (now - self.startTime) / self.timeout
+
+        # Numeric animation
+        for param, initialValue in self.initialNumberParams.items():
+            target = self.params[param]
+            newValue = initialValue + step * (target - initialValue)
+            self.widget.set(param, newValue)
+
+        # Tuple animation
+        for param, initialTuple in self.initialTupleParams.items():
+            target = self.params[param]
+            newValue = tuple(
+                initialTuple[i] + step * (target[i] - initialTuple[i]) for i in range(len(initialTuple)))
+            self.widget.set(param, newValue)
+
+        return False
+
+
+class AnimationHandler:
+    _animations: list[AnimationBase] = []
+
+    @staticmethod
+    def main() -> None:
+        """Advance every running animation by one frame. Called by pygame_widgets.update"""
+        if AnimationHandler._animations:
+            # All animations share the time of the frame
+            now = time.perf_counter()
+
+            # Animations started while updating are kept for the next frame
+            animations = AnimationHandler._animations
+            AnimationHandler._animations = []
+            AnimationHandler._animations.extend(
+                [animation for animation in animations if not animation.update(now)]
+            )
+
+    @staticmethod
+    def addAnimation(animation: AnimationBase) -> None:
+        AnimationHandler._animations.append(animation)
+
+    @staticmethod
+    def getAnimations() -> [AnimationBase]:
+        return AnimationHandler._animations
 
 
 class Translate(AnimationBase):
@@ -1,11 +1,21 @@
 import pygame
 
 import pygame_widgets
+from pygame_widgets.font import FontRegistry, TextCache
 from pygame_widgets.widget import WidgetBase
 from pygame_widgets.mouse import Mouse, MouseState
 
 
 class Button(WidgetBase):
+    # Number of colour states kept pre-rendered, e.g. inactive, hover and pressed
+    MAX_CACHED_SURFACES = 4
+
+    # Attributes that change the button in every colour state, so clear the pre-rendered surfaces when assigned
+    APPEARANCE_ATTRIBUTES = frozenset((
+        'radius', 'borderThickness', 'shadowDistance', 'shadowColour', 'string', 'textColour', 'font', 'textHAlign',
+        'textVAlign', 'margin', 'image', 'imageHAlign', 'imageVAlign'
+    ))
+
     def __init__(self, win, x, y, width, height, isSubWidget=False, **kwargs):
         """ A customisable button for Pygame
 
@@ -47,8 +57,8 @@ class Button(WidgetBase):
         self.textColour = kwargs.get('textColour', (0, 0, 0))
         self.fontSize = kwargs.get('fontSize', 20)
         self.string = kwargs.get('text', '')
-        self.font = kwargs.get('font', pygame.font.SysFont('calibri', self.fontSize))
-        self.text = self.font.render(self.string, True, self.textColour)
+        self.font = kwargs.get('font') or FontRegistry.getFont('calibri', self.fontSize)
+        self.text = TextCache.render(self.font, self.string, True, self.textColour)
         self.textHAlign = kwargs.get('textHAlign', 'centre')
         self.textVAlign = kwargs.get('textVAlign', 'centre')
         self.margin = kwargs.get('margin', 20)
@@ -76,6 +86,15 @@ class Button(WidgetBase):
 
         self.mouseWasInside = False
 
+        # Pre-rendered surfaces, None when they must be rendered again
+        self._surfaces = None  # [((colour, borderColour), (surface, offset))]
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in Button.APPEARANCE_ATTRIBUTES:
+            super().__setattr__('_surfaces', None)
+            super().__setattr__('_dirty', True)
+
     def alignImageRect(self):
         self.imageRect.center = (self._x + self._width // 2, self._y + self._height // 2)
 
@@ -111,6 +130,7 @@ class Button(WidgetBase):
         if not self._hidden and not self._disabled:
             mouseState = Mouse.getMouseState()
             x, y = Mouse.getMousePos()
+            previousColours = self.colour, self.borderColour
 
             if self.contains(x, y):
                 if mouseState == MouseState.RELEASE and self.clicked:
@@ -143,91 +163,161 @@ class Button(WidgetBase):
                 self.colour = self.inactiveColour
                 self.borderColour = self.inactiveBorderColour
 
+            if (self.colour, self.borderColour) != previousColours:
+                self.markDirty()
+
     def draw(self):
         """ Display to surface """
         if not self._hidden:
-            if pygame.version.vernum[0] < 2:
-                borderRects = [
-                    (self._x + self.radius, self._y, self._width - self.radius * 2, self._height),
-                    (self._x, self._y + self.radius, self._width, self._height - self.radius * 2),
-                ]
-
-                borderCircles = [
-                    (self._x + self.radius, self._y + self.radius),
-                    (self._x + self.radius, self._y + self._height - self.radius),
-                    (self._x + self._width - self.radius, self._y + self.radius),
-                    (self._x + self._width - self.radius, self._y + self._height - self.radius)
-                ]
-
-                backgroundRects = [
-                    (
-                        self._x + self.borderThickness + self.radius,
-                        self._y + self.borderThickness,
-                        self._width - 2 * (self.borderThickness + self.radius),
-                        self._height - 2 * self.borderThickness
-                    ),
-                    (
-                        self._x + self.borderThickness,
-                        self._y + self.borderThickness + self.radius,
-                        self._width - 2 * self.borderThickness,
-                        self._height - 2 * (self.borderThickness + self.radius)
-                    )
-                ]
-
-                backgroundCircles = [
-                    (self._x + self.radius + self.borderThickness,
-                     self._y + self.radius + self.borderThickness),
-                    (self._x + self.radius + self.borderThickness,
-                     self._y + self._height - self.radius - self.borderThickness),
-                    (self._x + self._width - self.radius - self.borderThickness,
-                     self._y + self.radius + self.borderThickness),
-                    (self._x + self._width - self.radius - self.borderThickness,
-                     self._y + self._height - self.radius - self.borderThickness)
-                ]
-
-                for rect in borderRects:
-                    pygame.draw.rect(self.win, self.borderColour, rect)
-
-                for circle in borderCircles:
-                    pygame.draw.circle(self.win, self.borderColour, circle, self.radius)
-
-                for rect in backgroundRects:
-                    pygame.draw.rect(self.win, self.colour, rect)
-
-                for circle in backgroundCircles:
-                    pygame.draw.circle(self.win, self.colour, circle, self.radius)
-            else:
-                pygame.draw.rect(
-                    self.win, self.shadowColour,
-                    (self._x + self.shadowDistance, self._y + self.shadowDistance, self._width, self._height),
-                    border_radius=self.radius
-                )
+            surface, (offsetX, offsetY) = self.getSurface()
+            self.win.blit(surface, (self._x + offsetX, self._y + offsetY))
 
-                pygame.draw.rect(
-                    self.win, self.borderColour, (self._x, self._y, self._width, self._height),
-                    border_radius=self.radius
-                )
+    def refresh(self):
+        """ Forget the pre-rendered surfaces so the button is rendered again when next drawn. Done automatically when
+        the attributes in APPEARANCE_ATTRIBUTES, the size or the image are changed
+        """
+        self._surfaces = []
+        self.text = TextCache.render(self.font, self.string, True, self.textColour)
+        self.markDirty()
+
+    def getSurface(self):
+        """ Get the pre-rendered button for its current colours. It is only rendered the first time the button is
+        drawn in those colours after a refresh
+
+        :return: The surface and its offset from the top left of the button
+        :rtype: tuple of (pygame.Surface, tuple of int)
+        """
+        if self._surfaces is None:
+            self.refresh()
+
+        # Colours may be unhashable so states are compared rather than looked up
+        state = (self.colour, self.borderColour)
+        for cachedState, rendered in self._surfaces:
+            if cachedState == state:
+                break
+        else:
+            if len(self._surfaces) >= self.MAX_CACHED_SURFACES:
+                self._surfaces.pop(0)
+
+            rendered = self.render()
+            self._surfaces.append((state, rendered))
+
+        return rendered
+
+    def render(self):
+        """ Render the button in its current colours onto a new surface
+
+        :return: The surface and its offset from the top left of the button
+        :rtype: tuple of (pygame.Surface, tuple of int)
+        """
+        buttonRect = pygame.Rect(self._x, self._y, self._width, self._height)
+        bounds = buttonRect.union(buttonRect.move(self.shadowDistance, self.shadowDistance))
 
-                pygame.draw.rect(
-                    self.win, self.colour, (self._x + self.borderThickness, self._y + self.borderThickness,
-                                            self._width - self.borderThickness * 2,
-                                            self._height - self.borderThickness * 2),
-                    border_radius=self.radius
+        self.textRect = self.text.get_rect()
+        self.alignTextRect()
+        bounds.union_ip(self.textRect)
+
+        if self.image:
+            self.imageRect = self.image.get_rect()
+            self.alignImageRect()
+            bounds.union_ip(self.imageRect)
+
+        # The surface is transparent around the rounded corners and shadow. The colours are drawn opaque, as they
+        # were when the button was drawn straight onto win
+        surface = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        colour, borderColour, shadowColour = (
+            Button.getOpaqueColour(c) for c in (self.colour, self.borderColour, self.shadowColour)
+        )
+        x = buttonRect.x - bounds.x
+        y = buttonRect.y - bounds.y
+        width = buttonRect.width
+        height = buttonRect.height
+
+        if pygame.version.vernum[0] < 2:
+            borderRects = [
+                (x + self.radius, y, width - self.radius * 2, height),
+                (x, y + self.radius, width, height - self.radius * 2),
+            ]
+
+            borderCircles = [
+                (x + self.radius, y + self.radius),
+                (x + self.radius, y + height - self.radius),
+                (x + width - self.radius, y + self.radius),
+                (x + width - self.radius, y + height - self.radius)
+            ]
+
+            backgroundRects = [
+                (
+                    x + self.borderThickness + self.radius,
+                    y + self.borderThickness,
+                    width - 2 * (self.borderThickness + self.radius),
+                    height - 2 * self.borderThickness
+                ),
+                (
+                    x + self.borderThickness,
+                    y + self.borderThickness + self.radius,
+                    width - 2 * self.borderThickness,
+                    height - 2 * (self.borderThickness + self.radius)
                 )
+            ]
+
+            backgroundCircles = [
+                (x + self.radius + self.borderThickness,
+                 y + self.radius + self.borderThickness),
+                (x + self.radius + self.borderThickness,
+                 y + height - self.radius - self.borderThickness),
+                (x + width - self.radius - self.borderThickness,
+                 y + self.radius + self.borderThickness),
+                (x + width - self.radius - self.borderThickness,
+                 y + height - self.radius - self.borderThickness)
+            ]
+
+            for rect in borderRects:
+                pygame.draw.rect(surface, borderColour, rect)
+
+            for circle in borderCircles:
+                pygame.draw.circle(surface, borderColour, circle, self.radius)
 
-            if self.image:
-                self.imageRect = self.image.get_rect()
-                self.alignImageRect()
-                self.win.blit(self.image, self.imageRect)
+            for rect in backgroundRects:
+                pygame.draw.rect(surface, colour, rect)
 
-            self.text = self.font.render(self.string, True, self.textColour)
-            self.textRect = self.text.get_rect()
-            self.alignTextRect()
-            self.win.blit(self.text, self.textRect)
+            for circle in backgroundCircles:
+                pygame.draw.circle(surface, colour, circle, self.radius)
+        else:
+            pygame.draw.rect(
+                surface, shadowColour,
+                (x + self.shadowDistance, y + self.shadowDistance, width, height),
+                border_radius=self.radius
+            )
+
+            pygame.draw.rect(
+                surface, borderColour, (x, y, width, height),
+                border_radius=self.radius
+            )
+
+            pygame.draw.rect(
+                surface, colour, (x + self.borderThickness, y + self.borderThickness,
+                                       width - self.borderThickness * 2,
+                                       height - self.borderThickness * 2),
+                border_radius=self.radius
+            )
+
+        if self.image:
+            surface.blit(self.image, self.imageRect.move(-bounds.x, -bounds.y))
+
+        surface.blit(self.text, self.textRect.move(-bounds.x, -bounds.y))
+
+        return surface, (bounds.x - buttonRect.x, bounds.y - buttonRect.y)
+
+    @staticmethod
+    def getOpaqueColour(colour):
+        colour = pygame.Color(colour)
+        colour.a = 255
+        return colour
 
     def setText(self, text):
         self.string = text
-        self.text = self.font.render(self.string, True, self.textColour)
+        self.refresh()
         self.textRect = self.text.get_rect()
         self.alignTextRect()
 
@@ -235,6 +325,15 @@ class Button(WidgetBase):
         self.image = image
         self.imageRect = self.image.get_rect()
         self.alignImageRect()
+        self.refresh()
+
+    def setWidth(self, width):
+        super().setWidth(width)
+        self.refresh()
+
+    def setHeight(self, height):
+        super().setHeight(height)
+        self.refresh()
 
     def setOnClick(self, onClick, params=()):
         self.onClick = onClick
@@ -250,12 +349,15 @@ class Button(WidgetBase):
 
     def setInactiveColour(self, colour):
         self.inactiveColour = colour
+        self.markDirty()
 
     def setPressedColour(self, colour):
         self.pressedColour = colour
+        self.markDirty()
 
     def setHoverColour(self, colour):
         self.hoverColour = colour
+        self.markDirty()
 
     def get(self, attr):
         parent = super().get(attr)
@@ -270,9 +372,37 @@ class Button(WidgetBase):
 
         if attr == 'colour':
             self.inactiveColour = value
+            self.markDirty()
+
+        elif attr not in ('x', 'y'):
+            self.refresh()
+
+    def getBoundingRect(self):
+        rect = super().getBoundingRect()
+        return rect.union(rect.move(self.shadowDistance, self.shadowDistance))
 
 
 class ButtonArray(WidgetBase):
+    # Button parameters shared by every cell in lightweight mode
+    CELL_ATTRIBUTES = (
+        'inactiveColour', 'hoverColour', 'pressedColour', 'shadowDistance', 'shadowColour', 'textColour', 'fontSize',
+        'font', 'textHAlign', 'textVAlign', 'margin', 'radius', 'borderThickness', 'inactiveBorderColour',
+        'hoverBorderColour', 'pressedBorderColour'
+    )
+
+    # Attributes the cells of a lightweight array are laid out and drawn from, so clear them when assigned
+    GRID_ATTRIBUTES = frozenset((
+        'shape', '_width', '_height', 'colour', 'borderRadius', 'leftBorder', 'rightBorder', 'topBorder',
+        'bottomBorder', 'separationThickness'
+    ))
+
+    # Parameters that lightweight mode cannot honour, as every cell is drawn from the same template
+    LIGHTWEIGHT_UNSUPPORTED = (
+        'inactiveColours', 'hoverColours', 'pressedColours', 'shadowDistances', 'shadowColours', 'onHovers',
+        'onHoverParams', 'onHover', 'textColours', 'fontSizes', 'fonts', 'textHAligns', 'textVAligns', 'margins',
+        'images', 'imageHAligns', 'imageVAligns', 'imageRotations', 'imageFills', 'imageZooms', 'radii'
+    )
+
     def __init__(self, win, x, y, width, height, shape, **kwargs):
         """ A collection of buttons
 
@@ -341,7 +471,179 @@ class ButtonArray(WidgetBase):
         }
 
         self.buttons = []
-        self.createButtons()
+
+        # Lightweight mode draws the cells from one template Button instead of creating a Button for each
+        self.lightweight = kwargs.get('lightweight', False)
+        if self.lightweight:
+            unsupported = [name for name in self.LIGHTWEIGHT_UNSUPPORTED if kwargs.get(name) is not None]
+            if unsupported:
+                raise ValueError(
+                    f'Cannot use {", ".join(unsupported)} in lightweight mode, only texts, onClicks, onReleases, '
+                    'onClickParams and onReleaseParams can differ between cells'
+                )
+
+            self._template = Button(
+                self.win, 0, 0, 0, 0, isSubWidget=True,
+                **{k: kwargs[k] for k in self.CELL_ATTRIBUTES if k in kwargs}
+            )
+            self._cellSurfaces = {}  # {(text, state): (surface, offset)}
+            self._gridSurface = None
+            self._hovered = None
+            self._pressed = None
+            self.createCells()
+        else:
+            self.createButtons()
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in ButtonArray.GRID_ATTRIBUTES:
+            super().__setattr__('_cellsStale', True)
+
+    def refresh(self):
+        """ Clear the cached cells of a lightweight array. Done automatically when the attributes in GRID_ATTRIBUTES
+        are assigned, call it after changing the texts or the cell parameters
+        """
+        self._cellsStale = True
+        self.markDirty()
+
+    def setTexts(self, texts):
+        self.buttonAttributes['text'] = texts
+        if self.lightweight:
+            self.refresh()
+        else:
+            for button, text in zip(self.buttons, texts):
+                button.setText(text)
+
+    def createCells(self):
+        """Size the cells of a lightweight array and clear its cached surfaces"""
+        self._cellsStale = False
+        across, down = self.shape
+        self._cellWidth = (self._width - self.separationThickness * (across - 1) - self.leftBorder -
+                           self.rightBorder) // across
+        self._cellHeight = (self._height - self.separationThickness * (down - 1) - self.topBorder -
+                            self.bottomBorder) // down
+        self._template._width = self._cellWidth
+        self._template._height = self._cellHeight
+        self._cellSurfaces = {}
+        self._gridSurface = None
+
+    def getCellAt(self, x, y):
+        """ Index of the cell at a point in a lightweight array, found from the cell size rather than by testing
+        every cell
+
+        :param x: X-coordinate on win
+        :param y: Y-coordinate on win
+        :return: Index of the cell, counting down each column in turn, or None if the point is not on a cell
+        :rtype: int or None
+        """
+        across, down = self.shape
+        i, cellX = divmod(x - self._x - self.leftBorder, self._cellWidth + self.separationThickness)
+        j, cellY = divmod(y - self._y - self.topBorder, self._cellHeight + self.separationThickness)
+        if 0 <= i < across and 0 <= j < down and cellX < self._cellWidth and cellY < self._cellHeight:
+            return i * down + j
+
+        return None
+
+    def getCellPosition(self, index):
+        """Top left of a cell of a lightweight array on win"""
+        i, j = divmod(index, self.shape[1])
+        return (
+            self._x + self.leftBorder + i * (self._cellWidth + self.separationThickness),
+            self._y + self.topBorder + j * (self._cellHeight + self.separationThickness)
+        )
+
+    def getCellSurface(self, index, state):
+        """ Get the pre-rendered cell for its text and state, shared by every cell with the same text
+
+        :param index: Index of the cell
+        :param state: 'inactive', 'hover' or 'pressed'
+        :return: The surface and its offset from the top left of the cell
+        :rtype: tuple of (pygame.Surface, tuple of int)
+        """
+        texts = self.buttonAttributes['text']
+        text = texts[index] if texts is not None else ''
+        key = (text, state)
+        if key not in self._cellSurfaces:
+            template = self._template
+            template.string = text
+            template.text = TextCache.render(template.font, text, True, template.textColour)
+            template.colour = getattr(template, state + 'Colour')
+            template.borderColour = getattr(template, state + 'BorderColour')
+            self._cellSurfaces[key] = template.render()
+
+        return self._cellSurfaces[key]
+
+    def getGridSurface(self):
+        """ Get the pre-rendered background and inactive cells of a lightweight array, re-rendered after the cells
+        are cleared
+
+        :return: The surface
+        :rtype: pygame.Surface
+        """
+        if self._cellsStale:
+            self.createCells()
+
+        if self._gridSurface is None:
+            surface = pygame.Surface((self._width, self._height), pygame.SRCALPHA if self.borderRadius else 0)
+            if pygame.version.vernum[0] < 2:
+                surface.fill(self.colour)
+            else:
+                pygame.draw.rect(surface, self.colour, surface.get_rect(), border_radius=self.borderRadius)
+
+            for index in range(self.numButtons):
+                cell, (offsetX, offsetY) = self.getCellSurface(index, 'inactive')
+                x, y = self.getCellPosition(index)
+                surface.blit(cell, (x - self._x + offsetX, y - self._y + offsetY))
+
+            self._gridSurface = surface
+
+        return self._gridSurface
+
+    def _callCell(self, callbacks, params, index):
+        callbacks = self.buttonAttributes[callbacks]
+        if callbacks is not None:
+            params = self.buttonAttributes[params]
+            callbacks[index](*(params[index] if params is not None else ()))
+
+    def _listenGrid(self):
+        if self._cellsStale:
+            self.createCells()
+
+        mouseState = Mouse.getMouseState()
+        x, y = Mouse.getMousePos()
+        previous = self._hovered, self._pressed
+
+        cell = None
+        if self.contains(x, y):
+            offsetX, offsetY = self.win.get_abs_offset()
+            cell = self.getCellAt(x - offsetX, y - offsetY)
+
+        if cell is None:
+            self._hovered = self._pressed = None
+
+        elif mouseState == MouseState.RELEASE and self._pressed == cell:
+            self._pressed = None
+            self._callCell('onRelease', 'onReleaseParams', cell)
+
+        elif mouseState == MouseState.CLICK:
+            self._pressed = cell
+            self._callCell('onClick', 'onClickParams', cell)
+
+        elif mouseState != MouseState.DRAG or self._pressed != cell:
+            self._pressed = None
+
+        self._hovered = cell
+        if (self._hovered, self._pressed) != previous:
+            self.markDirty()
+
+    def _drawGrid(self):
+        self.win.blit(self.getGridSurface(), (self._x, self._y))
+
+        if self._hovered is not None:
+            state = 'pressed' if self._pressed == self._hovered else 'hover'
+            cell, (offsetX, offsetY) = self.getCellSurface(self._hovered, state)
+            x, y = self.getCellPosition(self._hovered)
+            self.win.blit(cell, (x + offsetX, y + offsetY))
 
     def createButtons(self):
         across, down = self.shape
@@ -356,6 +658,7 @@ class ButtonArray(WidgetBase):
                 self.buttons.append(Button(self.win, x, y, width, height, isSubWidget=True,
                                            **{k: v[count] for k, v in self.buttonAttributes.items() if v is not None})
                                     )
+                self.addChild(self.buttons[-1])
                 count += 1
 
     def listen(self, events):
@@ -365,12 +668,19 @@ class ButtonArray(WidgetBase):
         :type events: list of pygame.event.Event
         """
         if not self._hidden and not self._disabled:
+            if self.lightweight:
+                self._listenGrid()
+
             for button in self.buttons:
+                button.updateTransform()
                 button.listen(events)
 
     def draw(self):
         """ Display to surface """
-        if not self._hidden:
+        if not self._hidden and self.lightweight:
+            self._drawGrid()
+
+        elif not self._hidden:
             rects = [
                 (self._x + self.borderRadius, self._y, self._width - self.borderRadius * 2, self._height),
                 (self._x, self._y + self.borderRadius, self._width, self._height - self.borderRadius * 2)
@@ -390,6 +700,7 @@ class ButtonArray(WidgetBase):
                 pygame.draw.circle(self.win, self.colour, circle, self.borderRadius)
 
             for button in self.buttons:
+                button.updateTransform()
                 button.draw()
 
     def getButtons(self):
@@ -3,6 +3,7 @@ from pygame_widgets import Mouse
 from pygame_widgets.widget import WidgetBase
 from pygame_widgets.textbox import TextBox
 from pygame_widgets.dropdown import Dropdown, DropdownChoice
+from pygame_widgets.search import SearchIndex
 
 
 class ComboBox(Dropdown):
@@ -30,6 +31,8 @@ class ComboBox(Dropdown):
         :type textboxKwargs: dict(str: Any)
         :param maxResults: The maximum number of results to display
         :type maxResults: int
+        :param visibleChoices: The number of results shown at once, scrolling with the mouse wheel to see the rest
+        :type visibleChoices: int
         :param kwargs: Optional parameters
         """
         WidgetBase.__init__(self, win, x, y, width, height)
@@ -41,8 +44,6 @@ class ComboBox(Dropdown):
         self.choices = choices
         self.suggestions = choices  # Stores the current suggestions
 
-        self._searchAlgo = kwargs.get('searchAlgo', self._defaultSearch)
-
         # Adds params that are not specified in text box
         for key, value in kwargs.items():
             if key not in textboxKwargs:
@@ -54,9 +55,17 @@ class ComboBox(Dropdown):
             **textboxKwargs
         )
         self.__main = self.textBar
+        self.addChild(self.textBar)
         # Set the number of choices if not given
         self.maxResults = kwargs.get('maxResults', len(choices))
 
+        # When set, only this many DropdownChoices are created and they are reused while scrolling
+        self._visibleChoices = kwargs.get('visibleChoices', None)
+        self._scroll = 0
+
+        # The default search gives the same results as _defaultSearch using an index built once from the choices
+        self._searchAlgo = kwargs.get('searchAlgo') or SearchIndex(self.choices, self.maxResults)
+
         self.createDropdownChoices(x, y, width, height, **kwargs)
 
         self.getText = self.textBar.getText
@@ -73,9 +82,13 @@ class ComboBox(Dropdown):
         """Create the widgets for the choices."""
         # We create the DropdownChoice(s)
         direction = kwargs.get('direction', 'down')
+        numberOfChoices = self.maxResults
+        if self._visibleChoices is not None:
+            numberOfChoices = min(self._visibleChoices, numberOfChoices)
+
         self.__choices = []
         for i, text in enumerate(self.choices):
-            if i == self.maxResults:
+            if i == numberOfChoices:
                 return
 
             if direction == 'down':
@@ -98,7 +111,7 @@ class ComboBox(Dropdown):
                 DropdownChoice(
                     self.win, x, y, width, height,
                     text=text, dropdown=self, value=i,
-                    last=(i == self.maxResults - 1),
+                    last=(i == numberOfChoices - 1),
                     **kwargs,
                 )
             )
@@ -112,8 +125,11 @@ class ComboBox(Dropdown):
         if not self._hidden and not self._disabled:
             # Keeps state of selected
             previouslySelected = self.textBar.selected
+            self.textBar.updateTransform()
             self.textBar.listen(events)
 
+            self._scrollChoices(events)
+
             if self._dropped:
                 for dropdownChoice in self.__choices:
                     dropdownChoice.listen(events)
@@ -134,17 +150,18 @@ class ComboBox(Dropdown):
     def draw(self):
         """Draw the widget."""
         if not self._hidden:
+            self.textBar.updateTransform()
             self.textBar.draw()
             if self._dropped:
                 # Find how many choices should be shown
-                numberVisible = min(len(self.suggestions), self.maxResults)
+                numberVisible = self._countItems() - self._scroll
                 for i, dropdownChoice in enumerate(self.__choices):
                     # Define if the the dropdown should be shown
                     if i < numberVisible:
                         dropdownChoice.show()
                         self.moveToTop()
                         # Choose the text to show
-                        dropdownChoice.text = self.suggestions[i]
+                        dropdownChoice.text = self.suggestions[self._scroll + i]
                     else:
                         dropdownChoice.hide()
                     dropdownChoice.draw()
@@ -153,6 +170,9 @@ class ComboBox(Dropdown):
         return super(Dropdown, self).contains(x, y) or \
                (any([c.contains(x, y) for c in self.__choices]) and self._dropped)
 
+    def getBoundingRect(self):
+        return super(Dropdown, self).getBoundingRect().unionall([c.getBoundingRect() for c in self.__choices])
+
     def updateSearchResults(self):
         """Update the suggested results based on selected text.
 
@@ -160,6 +180,7 @@ class ComboBox(Dropdown):
         search algorithms.
         """
         text = self.textBar.getText()
+        self._scroll = 0
 
         if text != '':
             # Finds all the texts that start with the same text
@@ -168,6 +189,25 @@ class ComboBox(Dropdown):
         else:
             self._dropped = False
 
+    def setX(self, x):
+        # The choices are positioned relative to the combo box and the text bar is a child, so both follow it
+        WidgetBase.setX(self, x)
+
+    def setY(self, y):
+        WidgetBase.setY(self, y)
+
+    def setWin(self, win):
+        WidgetBase.setWin(self, win)
+        for c in self.__choices:
+            c.win = win
+
+    def _countItems(self):
+        return min(len(self.suggestions), self.maxResults)
+
+    def _bindChoices(self):
+        # The suggestions are shown in draw
+        pass
+
     def _searchAlgo(self, text, choices):
         """Return the suggestions of text in choices."""
         raise NotImplementedError('A search method must override this.')
@@ -1,15 +1,22 @@
+from collections import namedtuple
+
 import pygame
 
 import pygame_widgets
-from pygame_widgets.widget import WidgetBase
+from pygame_widgets.font import FontRegistry, TextCache
+from pygame_widgets.widget import WidgetBase, WidgetHandler
 from pygame_widgets.mouse import Mouse, MouseState
 
+# The text and value of a choice, which stay the same when the DropdownChoice showing it is reused while scrolling
+DropdownItem = namedtuple('DropdownItem', ('text', 'value'))
+
 
 class Dropdown(WidgetBase):
     def __init__(self, win, x, y, width, height, name, choices, isSubWidget=False, **kwargs):
         super().__init__(win, x, y, width, height, isSubWidget)
         self._dropped = False
         self.__chosen = None
+        self._chosenItem = None  # DropdownItem of the chosen DropdownChoice, which may be reused while scrolling
 
         values = kwargs.get('values', None)
         if values is None:
@@ -20,11 +27,23 @@ class Dropdown(WidgetBase):
                 '\'choices\' and \'values\' arguments should be identical in size'
             )
 
+        # The choices as (text, value) pairs
+        self._items = list(zip(choices, values))
+
+        # When set, only this many DropdownChoices are created and they are reused while scrolling
+        self._visibleChoices = kwargs.get('visibleChoices', None)
+        self._scroll = 0
+
+        numberOfChoices = len(self._items)
+        if self._visibleChoices is not None:
+            numberOfChoices = min(self._visibleChoices, numberOfChoices)
+
         # we create the DropdownChoice(s)
         direction = kwargs.get('direction', 'down')
         self.__choices = []
-        for i, text in enumerate(choices):
-            last = (i == len(choices) - 1)
+        for i in range(numberOfChoices):
+            text, value = self._items[i]
+            last = (i == numberOfChoices - 1)
 
             if direction == 'down':
                 x = 0
@@ -44,7 +63,7 @@ class Dropdown(WidgetBase):
 
             choice = DropdownChoice(
                 self.win, x, y, width, height,
-                text=text, dropdown=self, value=values[i], last=last,
+                text=text, dropdown=self, value=value, last=last,
                 **kwargs
             )
             choice.hide()
@@ -79,6 +98,8 @@ class Dropdown(WidgetBase):
                 elif mouseState == MouseState.RELEASE:
                     self.onRelease(*self.onReleaseParams)
 
+            self._scrollChoices(events)
+
             # Then we handle the DropdownChoices
             self.__main.listen(events)
             for c in self.__choices:
@@ -93,11 +114,66 @@ class Dropdown(WidgetBase):
     def contains(self, x, y):
         return super().contains(x, y) or (any([c.contains(x, y) for c in self.__choices]) and self._dropped)
 
+    def getBoundingRect(self):
+        return super().getBoundingRect().unionall([c.getBoundingRect() for c in self.__choices])
+
+    def isDirty(self):
+        # Hover colours of the choices are not tracked
+        return True
+
     def reset(self):
         self.__chosen = None
+        self._chosenItem = None
 
     def getSelected(self):
-        return self.__chosen._value if self.__chosen is not None else None
+        return self._chosenItem[1] if self._chosenItem is not None else None
+
+    def getChosenItem(self):
+        """ The text and value of the chosen item, which, unlike chosen, stay correct while scrolling
+
+        :return: The item, or None if nothing is chosen
+        :rtype: DropdownItem or None
+        """
+        return self._chosenItem
+
+    def getScroll(self):
+        return self._scroll
+
+    def setScroll(self, scroll):
+        """ Scroll the choices so that the choice at the given index is shown first. Only has an effect when
+        visibleChoices is set and there are more choices than that
+
+        :param scroll: Index of the first choice shown
+        :type scroll: int
+        """
+        if self._visibleChoices is None:
+            return
+
+        scroll = max(0, min(scroll, self._countItems() - self._visibleChoices))
+        if scroll != self._scroll:
+            self._scroll = scroll
+            self._bindChoices()
+            self.markDirty()
+
+    def setWin(self, win):
+        super().setWin(win)
+        self.__main.win = win
+        for c in self.__choices:
+            c.win = win
+
+    def _countItems(self):
+        return len(self._items)
+
+    def _bindChoices(self):
+        """Show the scrolled to items in the reused DropdownChoices"""
+        for i, c in enumerate(self.__choices):
+            c.text, c._value = self._items[self._scroll + i]
+
+    def _scrollChoices(self, events):
+        if self._dropped and self._visibleChoices is not None and self.contains(*Mouse.getMousePos()):
+            for event in events:
+                if event.type == pygame.MOUSEWHEEL:
+                    self.setScroll(self._scroll - event.y)
 
     def toggleDropped(self):
         self._dropped = not self._dropped
@@ -114,12 +190,22 @@ class Dropdown(WidgetBase):
 
     @property
     def chosen(self):
-        return self.__chosen
+        """ The chosen DropdownChoice. When visibleChoices is set, the DropdownChoices are reused while scrolling, so
+        this is None once the chosen one shows another item. Use getChosenItem to get the item itself
+
+        :rtype: DropdownChoice or None
+        """
+        chosen = self.__chosen
+        if chosen is not None and self._visibleChoices is not None \
+                and DropdownItem(chosen.text, chosen._value) != self._chosenItem:
+            return None
+        return chosen
 
     @chosen.setter
     def chosen(self, newChosen):
         if isinstance(newChosen, DropdownChoice):
             self.__chosen = newChosen
+            self._chosenItem = DropdownItem(newChosen.text, newChosen._value)
         else:
             raise TypeError(
                 'Wrong type for \'chosen\' property, DropdownChoice is expected'
@@ -130,6 +216,7 @@ class Dropdown(WidgetBase):
             self.toggleDropped()
 
     def setX(self, x):
+        self.updateTransform()
         self._x = x
         for i, c in enumerate(self.__choices):
             if c.direction == 'down':
@@ -140,8 +227,10 @@ class Dropdown(WidgetBase):
                 c._x = (i + 1) * c.getWidth()
             elif c.direction == 'left':
                 c._x = -(i + 1) * c.getWidth()
+        WidgetHandler.updateWidget(self)
 
     def setY(self, y):
+        self.updateTransform()
         self._y = y
         for i, c in enumerate(self.__choices):
             if c.direction == 'down':
@@ -152,8 +241,10 @@ class Dropdown(WidgetBase):
                 c._y = 0
             elif c.direction == 'left':
                 c._y = 0
+        WidgetHandler.updateWidget(self)
 
     def setWidth(self, width):
+        self.updateTransform()
         self._width = width
         for i, c in enumerate(self.__choices):
             c.setWidth(width)
@@ -166,8 +257,10 @@ class Dropdown(WidgetBase):
             elif c.direction == 'left':
                 c._x = -(i + 1) * c.getWidth()
         self.__main.setWidth(width)
+        WidgetHandler.updateWidget(self)
 
     def setHeight(self, height):
+        self.updateTransform()
         self._height = height
         for i, c in enumerate(self.__choices):
             c.setHeight(height)
@@ -180,6 +273,7 @@ class Dropdown(WidgetBase):
             elif c.direction == 'left':
                 c._y = 0
         self.__main.setHeight(height)
+        WidgetHandler.updateWidget(self)
 
 
 class DropdownChoice(WidgetBase):
@@ -205,7 +299,7 @@ class DropdownChoice(WidgetBase):
         # Text
         self.textColour = kwargs.get('textColour', (0, 0, 0))
         self.fontSize = kwargs.get('fontSize', 20)
-        self.font = kwargs.get('font', pygame.font.SysFont('sans-serif', self.fontSize))
+        self.font = kwargs.get('font') or FontRegistry.getFont('sans-serif', self.fontSize)
         self.textHAlign = kwargs.get('textHAlign', 'centre')
 
         self.textOffsetLeft = self.fontSize // 5
@@ -232,7 +326,7 @@ class DropdownChoice(WidgetBase):
                 **self._computeBorderRadii()
             )
 
-            text_rendered = self.font.render(self.text, True, self.textColour)
+            text_rendered = TextCache.render(self.font, self.text, True, self.textColour)
 
             if self.textHAlign == 'centre':
                 text_rect = text_rendered.get_rect(
@@ -294,6 +388,9 @@ class DropdownChoice(WidgetBase):
                 and self.computedY < y < self.computedY + self._height
         )
 
+    def getBoundingRect(self):
+        return pygame.Rect(self.computedX, self.computedY, self._width, self._height)
+
     def _computeBorderRadii(self):
         borderRadius = {}
         if not self.last:
@@ -428,7 +525,7 @@ class HeadDropdown(DropdownChoice):
 
     @property
     def text(self):
-        return self._dropdown.chosen.text if self._dropdown.chosen is not None else self.__head_text
+        return self._dropdown._chosenItem[0] if self._dropdown._chosenItem is not None else self.__head_text
 
 
 if __name__ == '__main__':
@@ -0,0 +1,180 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class FontRegistry:
+    # Number of fonts kept, the least recently used is dropped first
+    MAX_FONTS = 32
+
+    _fonts = OrderedDict()  # {(name, size, bold, italic): pygame.font.Font}
+    _hits = 0
+    _misses = 0
+
+    @staticmethod
+    def getFont(name, size, bold=False, italic=False):
+        """ Get a system font shared by every widget asking for the same one, only loading it the first time
+
+        Widgets may share the font, so it should not be changed with methods such as set_bold. Pass a font of your
+        own to a widget to do that
+
+        :param name: Name of the system font, as for pygame.font.SysFont
+        :type name: str
+        :param size: Size of the font
+        :type size: int
+        :param bold: Whether the font is bold
+        :type bold: bool
+        :param italic: Whether the font is italic
+        :type italic: bool
+        :return: The font
+        :rtype: pygame.font.Font
+        """
+        key = (name, size, bool(bold), bool(italic))
+        font = FontRegistry._fonts.get(key)
+        if font is not None:
+            FontRegistry._hits += 1
+            FontRegistry._fonts.move_to_end(key)
+            return font
+
+        FontRegistry._misses += 1
+        font = pygame.font.SysFont(name, size, bold, italic)
+        FontRegistry._fonts[key] = font
+        while len(FontRegistry._fonts) > FontRegistry.MAX_FONTS:
+            FontRegistry._fonts.popitem(last=False)
+
+        return font
+
+    @staticmethod
+    def setMaxFonts(maxFonts):
+        FontRegistry.MAX_FONTS = maxFonts
+        while len(FontRegistry._fonts) > maxFonts:
+            FontRegistry._fonts.popitem(last=False)
+
+    @staticmethod
+    def clear():
+        """Forget every font. Widgets keep the fonts they already have"""
+        FontRegistry._fonts.clear()
+        FontRegistry._hits = 0
+        FontRegistry._misses = 0
+
+    @staticmethod
+    def getStats():
+        """ Usage of the registry
+
+        :return: The number of fonts held, and the number of requests served from and not from the registry
+        :rtype: dict
+        """
+        return {'fonts': len(FontRegistry._fonts), 'hits': FontRegistry._hits, 'misses': FontRegistry._misses}
+
+
+class TextCache:
+    # Approximate memory the cached surfaces may use, the least recently used are dropped first
+    MAX_BYTES = 8 * 1024 * 1024
+
+    _surfaces = OrderedDict()  # {(font, text, antialias, colour, background): pygame.Surface}
+    _bytes = 0
+    _hits = 0
+    _misses = 0
+
+    @staticmethod
+    def render(font, text, antialias, colour, background=None):
+        """ Render text with a font, as font.render, only rasterising it the first time it is rendered by any widget
+
+        The surface is shared, so it must not be drawn onto. Copy it first to do that
+
+        :param font: Font to render with
+        :type font: pygame.font.Font
+        :param text: Text to render
+        :type text: str
+        :param antialias: Whether to antialias the text
+        :type antialias: bool
+        :param colour: Colour of the text
+        :param background: Colour behind the text, or None for a transparent background
+        :return: The rendered text
+        :rtype: pygame.Surface
+        """
+        key = (
+            font, text, bool(antialias), TextCache.getColourKey(colour),
+            None if background is None else TextCache.getColourKey(background)
+        )
+        surface = TextCache._surfaces.get(key)
+        if surface is not None:
+            TextCache._hits += 1
+            TextCache._surfaces.move_to_end(key)
+            return surface
+
+        TextCache._misses += 1
+        surface = font.render(text, antialias, colour, background)
+        size = TextCache.getSize(surface)
+        if size <= TextCache.MAX_BYTES:
+            TextCache._surfaces[key] = surface
+            TextCache._bytes += size
+            TextCache._evict(TextCache.MAX_BYTES)
+
+        return surface
+
+    @staticmethod
+    def prewarm(font, texts, colour, antialias=True, background=None):
+        """ Render texts ahead of time, e.g. while loading, so the first frame showing them does not have to
+
+        :param font: Font the texts will be rendered with
+        :param texts: Texts to render
+        :type texts: iterable of str
+        :param colour: Colour of the text
+        :param antialias: Whether to antialias the text
+        :param background: Colour behind the text, or None for a transparent background
+        """
+        for text in texts:
+            TextCache.render(font, text, antialias, colour, background)
+
+    @staticmethod
+    def setMaxBytes(maxBytes):
+        TextCache.MAX_BYTES = maxBytes
+        TextCache._evict(maxBytes)
+
+    @staticmethod
+    def clear():
+        TextCache._surfaces.clear()
+        TextCache._bytes = 0
+        TextCache._hits = 0
+        TextCache._misses = 0
+
+    @staticmethod
+    def getStats():
+        """ Usage of the cache
+
+        :return: The number of surfaces held, their approximate size in bytes, and the number of renders served
+            from and not from the cache
+        :rtype: dict
+        """
+        return {
+            'surfaces': len(TextCache._surfaces), 'bytes': TextCache._bytes,
+            'hits': TextCache._hits, 'misses': TextCache._misses
+        }
+
+    @staticmethod
+    def getColourKey(colour):
+        # pygame.Color and lists cannot be used as dictionary keys
+        return colour if isinstance(colour, (tuple, str)) else tuple(colour)
+
+    @staticmethod
+    def getSize(surface):
+        return surface.get_pitch() * surface.get_height()
+
+    @staticmethod
+    def _evict(maxBytes):
+        while TextCache._bytes > maxBytes:
+            _, surface = TextCache._surfaces.popitem(last=False)
+            TextCache._bytes -= TextCache.getSize(surface)
+
+
+if __name__ == '__main__':
+    pygame.init()
+
+    first = FontRegistry.getFont('calibri', 20)
+    second = FontRegistry.getFont('calibri', 20)
+    print(first is second, FontRegistry.getStats())
+
+    TextCache.prewarm(first, [str(i) for i in range(10)], (0, 0, 0))
+    TextCache.render(first, '1', True, (0, 0, 0))
+    print(TextCache.getStats())
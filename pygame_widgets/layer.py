@@ -0,0 +1,222 @@
+import pygame
+
+import pygame_widgets
+from pygame_widgets.widget import WidgetBase, WidgetHandler
+from pygame_widgets.mouse import Mouse
+
+
+class LayerSurface(pygame.Surface):
+    def __init__(self, size, flags, layer):
+        """ Offscreen surface of a Layer. Reports the position of the layer on the screen as its offset, as a
+        subsurface would, so that the children drawn on it find the mouse where they appear
+
+        :param size: Size of the layer
+        :param flags: Surface flags
+        :param layer: The layer
+        :type layer: Layer
+        """
+        super().__init__(size, flags)
+        self.layer = layer
+
+    def get_abs_offset(self):
+        offsetX, offsetY = self.layer.win.get_abs_offset()
+        return offsetX + self.layer.getX(), offsetY + self.layer.getY()
+
+
+class Layer(WidgetBase):
+    def __init__(self, win, x, y, width, height, **kwargs):
+        """ A group of widgets drawn onto an offscreen surface, which is only redrawn when one of them changes and
+        is otherwise blitted in one call
+
+        :param win: Surface on which to draw
+        :type win: pygame.Surface
+        :param x: X-coordinate of top left
+        :type x: int
+        :param y: Y-coordinate of top left
+        :type y: int
+        :param width: Width of layer
+        :type width: int
+        :param height: Height of layer
+        :type height: int
+        :param kwargs: Optional parameters
+        """
+        super().__init__(win, x, y, width, height)
+
+        # Background colour, transparent if None
+        self.colour = kwargs.get('colour', None)
+        self.alpha = kwargs.get('alpha', 255)
+
+        self._surface = None
+        self._composite = None  # The surface with the layer's alpha applied, blitted onto win
+        self._rendered = False
+        self.createSurface()
+
+        for child in kwargs.get('children', ()):
+            self.addChild(child)
+
+    def createSurface(self):
+        old = self._surface
+        flags = pygame.SRCALPHA if self.colour is None or pygame.Color(self.colour).a < 255 else 0
+        self._surface = LayerSurface((self._width, self._height), flags, self)
+        self._composite = None
+        self._rendered = False
+
+        if old is not None:
+            for child in self._children:
+                child.setWin(self._surface)
+
+    def getSurface(self):
+        """Surface to create the children of the layer on, with coordinates relative to the top left of the layer"""
+        return self._surface
+
+    def getChildOrigin(self):
+        # Children are positioned on the layer's own surface
+        return 0, 0
+
+    def addChild(self, child):
+        """ Draw a widget on the layer. A widget created on the layer's win is moved onto its surface, keeping its
+        position on the screen, and its children with it
+
+        :param child: The widget
+        :type child: WidgetBase
+        """
+        if child.win is not self._surface:
+            self.updateTransform()
+            child.updateTransform()
+            child._x -= self._x
+            child._y -= self._y
+            child.setWin(self._surface)
+
+        super().addChild(child)
+        self._rendered = False
+
+    def removeChild(self, child):
+        """ Stop drawing a widget on the layer. It is moved back onto the layer's win, keeping its position on the
+        screen
+
+        :param child: The widget
+        :type child: WidgetBase
+        """
+        super().removeChild(child)
+        self.updateTransform()
+        child._x += self._x
+        child._y += self._y
+        child.setWin(self.win)
+        WidgetHandler.updateWidget(child)
+        self._rendered = False
+
+    def setAlpha(self, alpha):
+        if alpha != self.alpha:
+            self.alpha = alpha
+            self._composite = None
+            self.markDirty()
+
+    def setWidth(self, width):
+        super().setWidth(width)
+        self.createSurface()
+
+    def setHeight(self, height):
+        super().setHeight(height)
+        self.createSurface()
+
+    def listen(self, events):
+        """ Wait for inputs
+
+        :param events: Use pygame.event.get()
+        :type events: list of pygame.event.Event
+        """
+        if not self._hidden and not self._disabled:
+            x, y = Mouse.getMousePos()
+
+            # As in the WidgetHandler, widgets covered by others at the mouse are not affected
+            blocked = False
+            for child in self._children[::-1]:
+                child.updateTransform()
+                if not blocked:
+                    child.listen(events)
+                    if child.contains(x, y):
+                        blocked = True
+
+                elif not child.contains(x, y):
+                    child.listen(events)
+
+    def contains(self, x, y):
+        # Only block the widgets beneath where a child is
+        return not self._hidden and any(child.contains(x, y) for child in self._children if child.isVisible())
+
+    def isDirty(self):
+        return self._dirty or not self._rendered or any(child.isDirty() for child in self._children)
+
+    def markClean(self):
+        # The children are marked clean when they are drawn onto the surface
+        self._dirty = False
+
+    def render(self):
+        """Redraw the children onto the surface"""
+        if self.colour is None:
+            self._surface.fill((0, 0, 0, 0))
+        else:
+            self._surface.fill(self.colour)
+
+        for child in self._children:
+            child.updateTransform()
+            child.draw()
+            child.markClean()
+
+        self._rendered = True
+        self._composite = None
+
+    def getComposite(self):
+        """ The surface to blit onto win. Per-pixel alpha combined with surface alpha is slow to blit, so for a
+        transparent layer the alpha is multiplied into a copy of the surface once, when it changes
+        """
+        if self._composite is None:
+            if not self._surface.get_flags() & pygame.SRCALPHA:
+                self._surface.set_alpha(self.alpha if self.alpha < 255 else None)
+                self._composite = self._surface
+
+            elif self.alpha < 255:
+                self._composite = self._surface.copy()
+                self._composite.fill((255, 255, 255, self.alpha), special_flags=pygame.BLEND_RGBA_MULT)
+
+            else:
+                self._composite = self._surface
+
+        return self._composite
+
+    def draw(self):
+        """ Display to surface """
+        if not self._hidden:
+            if not self._rendered or any(child.isDirty() for child in self._children):
+                self.render()
+
+            self.win.blit(self.getComposite(), (self._x, self._y))
+
+
+if __name__ == '__main__':
+    from pygame_widgets.button import Button
+    from pygame_widgets.slider import Slider
+
+    pygame.init()
+    win = pygame.display.set_mode((800, 600))
+
+    hud = Layer(win, 50, 50, 700, 500, alpha=200)
+    for i in range(100):
+        hud.addChild(Button(win, 60 + 68 * (i % 10), 60 + 40 * (i // 10), 60, 30, text=str(i), radius=5))
+
+    slider = Slider(win, 100, 500, 600, 20, min=0, max=255, initial=200)
+
+    run = True
+    while run:
+        events = pygame.event.get()
+        for event in events:
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                run = False
+                quit()
+
+        win.fill((255, 255, 255))
+
+        hud.setAlpha(slider.getValue())
+        pygame_widgets.update(events)
+        pygame.display.update()
@@ -1,6 +1,9 @@
+from collections import deque
 from enum import Enum
 import pygame
+import threading
 import time
+import warnings
 
 
 class MouseState(Enum):
@@ -11,77 +14,335 @@ class MouseState(Enum):
     RIGHT_DRAG = 4  # Not sure when this is ever used but added anyway for completeness
     RELEASE = 5
     RIGHT_RELEASE = 6
+    DOUBLE_CLICK = 7  # Only returned by Mouse.getMouseState(multiClick=True), otherwise CLICK
+    TRIPLE_CLICK = 8
 
 
 class Mouse:
     _refreshTime = 0.01
 
-    # Redundant currently, may use for double click handling
+    # Times of the last presses and since the last presses in milliseconds, see pygame.time.get_ticks
     lastLeftClick = 0
     lastRightClick = 0
     leftClickElapsedTime = 0
     rightClickElapsedTime = 0
 
+    # Left presses this close together in time (ms) and space (px) count as double and triple clicks
+    _multiClickTime = 500
+    _multiClickDistance = 4
+    _clickCount = 0
+    _lastClickPos = (0, 0)
+
     _mouseState = MouseState.HOVER
+    _mousePos = (0, 0)  # Read once per update so widgets do not each ask SDL
+    _inputTimestamp = None  # When the press or release delivered this frame happened, see pygame.time.get_ticks
+
+    # Presses and releases waiting to be delivered, one per update, as (event type, button, pos, timestamp)
+    _transitions = deque()
+    _latestPos = (0, 0)
+    _held = {1: False, 3: False}  # Buttons held according to the samples of a threaded InputPump
+    _eventDriven = False
+
+    _inputPump = None  # The InputPump that owns updating the state
 
     @staticmethod
     def listen():
-        listening = True
-        while listening:
-            try:
-                Mouse.updateMouseState()
-            except pygame.error:
-                listening = False
-            time.sleep(Mouse._refreshTime)
+        """Deprecated: the mouse used to be polled in a loop here, racing with pygame_widgets.update.
+        Starts a threaded InputPump instead and returns immediately
+        """
+        warnings.warn(
+            'Mouse.listen is deprecated, use Mouse.setInputPump(InputPump(threaded=True)) instead',
+            DeprecationWarning, stacklevel=2
+        )
+        if not Mouse._inputPump.threaded:
+            Mouse.setInputPump(InputPump(threaded=True))
+
+    @staticmethod
+    def pump(events):
+        """ Update the mouse state for this frame through the input pump. Called by pygame_widgets.update
+
+        :param events: Use pygame.event.get()
+        :type events: list of pygame.event.Event
+        """
+        Mouse._inputPump.update(events)
+
+    @staticmethod
+    def setInputPump(inputPump):
+        """ Replace the input pump, stopping the previous one
+
+        :param inputPump: The new input pump
+        :type inputPump: InputPump
+        """
+        Mouse._inputPump.stop()
+        Mouse._inputPump = inputPump
+        inputPump.start()
 
     @staticmethod
-    def updateMouseState():
-        leftPressed = pygame.mouse.get_pressed()[0]
-        rightPressed = pygame.mouse.get_pressed()[2]
+    def getInputPump():
+        return Mouse._inputPump
+
+    @staticmethod
+    def updateMouseState(events=None):
+        """ Update the mouse state and position for this frame
+
+        :param events: Use pygame.event.get(). Only needed when event driven
+        :type events: list of pygame.event.Event
+        """
+        if Mouse._eventDriven:
+            Mouse._updateFromEvents(events or [])
+            return
+
+        Mouse._mousePos = pygame.mouse.get_pos()
+        Mouse._inputTimestamp = None
+        pressed = pygame.mouse.get_pressed()
+        leftPressed = pressed[0]
+        rightPressed = pressed[2]
 
         if leftPressed:
             if Mouse._mouseState == MouseState.CLICK or Mouse._mouseState == MouseState.DRAG:
                 Mouse._mouseState = MouseState.DRAG
             else:
                 Mouse._mouseState = MouseState.CLICK
+                Mouse._inputTimestamp = pygame.time.get_ticks()
+                Mouse._registerPress(1, Mouse._mousePos, Mouse._inputTimestamp)
 
         elif rightPressed:
             if Mouse._mouseState == MouseState.RIGHT_CLICK or Mouse._mouseState == MouseState.RIGHT_DRAG:
                 Mouse._mouseState = MouseState.RIGHT_DRAG
             else:
                 Mouse._mouseState = MouseState.RIGHT_CLICK
+                Mouse._inputTimestamp = pygame.time.get_ticks()
+                Mouse._registerPress(3, Mouse._mousePos, Mouse._inputTimestamp)
         else:
             # If previously was held down, call the release
             if Mouse._mouseState == MouseState.CLICK or Mouse._mouseState == MouseState.DRAG:
                 Mouse._mouseState = MouseState.RELEASE
+                Mouse._inputTimestamp = pygame.time.get_ticks()
 
             elif Mouse._mouseState == MouseState.RIGHT_CLICK or Mouse._mouseState == MouseState.RIGHT_DRAG:
                 Mouse._mouseState = MouseState.RIGHT_RELEASE
+                Mouse._inputTimestamp = pygame.time.get_ticks()
 
             else:
                 Mouse._mouseState = MouseState.HOVER
 
+    @staticmethod
+    def _updateFromEvents(events):
+        for event in events:
+            if event.type == pygame.MOUSEMOTION:
+                Mouse._latestPos = event.pos
+
+            elif event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP) and event.button in (1, 3):
+                Mouse._latestPos = event.pos
+                timestamp = getattr(event, 'timestamp', pygame.time.get_ticks())
+                Mouse._transitions.append((event.type, event.button, event.pos, timestamp))
+
+        Mouse._advance()
+
+    @staticmethod
+    def _updateFromSamples(samples):
+        """Turn the button changes seen by a sampling thread into presses and releases"""
+        for timestamp, pos, leftPressed, rightPressed in samples:
+            Mouse._latestPos = pos
+
+            for button, pressed in ((1, leftPressed), (3, rightPressed)):
+                if pressed != Mouse._held[button]:
+                    Mouse._held[button] = pressed
+                    eventType = pygame.MOUSEBUTTONDOWN if pressed else pygame.MOUSEBUTTONUP
+                    Mouse._transitions.append((eventType, button, pos, timestamp))
+
+        Mouse._advance()
+
+    @staticmethod
+    def _advance():
+        """Deliver the next queued press or release, or carry on from the last state if there are none"""
+        if Mouse._transitions:
+            # Deliver a queued press or release where it happened, so fast clicks are never lost
+            eventType, button, Mouse._mousePos, timestamp = Mouse._transitions.popleft()
+            Mouse._inputTimestamp = timestamp
+
+            if eventType == pygame.MOUSEBUTTONDOWN:
+                Mouse._mouseState = MouseState.CLICK if button == 1 else MouseState.RIGHT_CLICK
+                Mouse._registerPress(button, Mouse._mousePos, timestamp)
+            else:
+                Mouse._mouseState = MouseState.RELEASE if button == 1 else MouseState.RIGHT_RELEASE
+
+            return
+
+        Mouse._mousePos = Mouse._latestPos
+        Mouse._inputTimestamp = None
+
+        if Mouse._mouseState == MouseState.CLICK or Mouse._mouseState == MouseState.DRAG:
+            Mouse._mouseState = MouseState.DRAG
+
+        elif Mouse._mouseState == MouseState.RIGHT_CLICK or Mouse._mouseState == MouseState.RIGHT_DRAG:
+            Mouse._mouseState = MouseState.RIGHT_DRAG
+
+        else:
+            Mouse._mouseState = MouseState.HOVER
+
+    @staticmethod
+    def _registerPress(button, pos, timestamp):
+        """Count repeated left presses close together as double and triple clicks"""
+        if button != 1:
+            Mouse.lastRightClick = timestamp
+            return
+
+        if (
+            0 < Mouse._clickCount < 3
+            and timestamp - Mouse.lastLeftClick <= Mouse._multiClickTime
+            and abs(pos[0] - Mouse._lastClickPos[0]) <= Mouse._multiClickDistance
+            and abs(pos[1] - Mouse._lastClickPos[1]) <= Mouse._multiClickDistance
+        ):
+            Mouse._clickCount += 1
+        else:
+            Mouse._clickCount = 1
+
+        Mouse.lastLeftClick = timestamp
+        Mouse._lastClickPos = pos
+
+    @staticmethod
+    def enableEventDriven():
+        """Read presses, releases and motion from the events passed to pygame_widgets.update instead of polling.
+        Every press and release is then delivered, one per frame, even if several happen within a frame
+        """
+        Mouse._eventDriven = True
+        Mouse._latestPos = Mouse._mousePos = pygame.mouse.get_pos()
+
+    @staticmethod
+    def disableEventDriven():
+        Mouse._eventDriven = False
+        Mouse._transitions.clear()
+
+    @staticmethod
+    def isEventDriven():
+        return Mouse._eventDriven
+
     @staticmethod
     def updateElapsedTime():
-        """Also redundant until double click functionality implemented"""
+        """Update the time in milliseconds that the held button has been pressed for"""
         if Mouse._mouseState == MouseState.CLICK or Mouse._mouseState == MouseState.DRAG:
-            Mouse.leftClickElapsedTime = time.time() - Mouse.lastLeftClick
+            Mouse.leftClickElapsedTime = pygame.time.get_ticks() - Mouse.lastLeftClick
         elif Mouse._mouseState == MouseState.RIGHT_CLICK or Mouse._mouseState == MouseState.RIGHT_DRAG:
-            Mouse.rightClickElapsedTime = time.time() - Mouse.lastRightClick
+            Mouse.rightClickElapsedTime = pygame.time.get_ticks() - Mouse.lastRightClick
 
     @staticmethod
-    def getMouseState() -> MouseState:
+    def getMouseState(multiClick=False) -> MouseState:
+        """ Get the state of the mouse for this frame
+
+        :param multiClick: Return DOUBLE_CLICK or TRIPLE_CLICK instead of CLICK for repeated clicks
+        :type multiClick: bool
+        """
+        if multiClick and Mouse._mouseState == MouseState.CLICK and Mouse._clickCount > 1:
+            return MouseState.DOUBLE_CLICK if Mouse._clickCount == 2 else MouseState.TRIPLE_CLICK
+
         return Mouse._mouseState
 
+    @staticmethod
+    def getInputTimestamp():
+        """When the press or release delivered this frame happened, in pygame.time.get_ticks milliseconds, or None.
+        Later than the real press when polling
+        """
+        return Mouse._inputTimestamp
+
+    @staticmethod
+    def getClickCount():
+        """Number of left clicks in a row of the last left press, from 1 to 3"""
+        return Mouse._clickCount
+
+    @staticmethod
+    def setMultiClickTime(milliseconds):
+        Mouse._multiClickTime = milliseconds
+
+    @staticmethod
+    def setMultiClickDistance(pixels):
+        Mouse._multiClickDistance = pixels
+
     @staticmethod
     def getMousePos() -> (int, int):
-        return pygame.mouse.get_pos()
+        """The mouse position at the last update"""
+        return Mouse._mousePos
 
     @staticmethod
     def setRefreshRatePerSec(refreshRate):
         Mouse._refreshTime = 1 / refreshRate if refreshRate != 0 else 0
 
 
+class InputPump:
+    def __init__(self, threaded=False):
+        """ Owns updating the Mouse state. Only the thread that first updates the pump may update it afterwards, so
+        each state is delivered exactly once
+
+        :param threaded: Sample the mouse buttons on a background thread, at Mouse.setRefreshRatePerSec, between
+            frames. The samples are handed over through a queue and turned into states by the owning thread
+        :type threaded: bool
+        """
+        self.threaded = threaded
+
+        self._samples = deque()  # (timestamp, pos, left pressed, right pressed), appended by the sampling thread
+        self._thread = None
+        self._running = False
+        self._owner = None
+
+    def start(self):
+        if self.threaded and self._thread is None:
+            self._running = True
+            self._thread = threading.Thread(target=self._sample, daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._running = False
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    def isRunning(self):
+        return self._running
+
+    def _sample(self):
+        lastSample = None
+        while self._running:
+            try:
+                pressed = pygame.mouse.get_pressed()
+                sample = (pygame.mouse.get_pos(), pressed[0], pressed[2])
+            except pygame.error:
+                break
+
+            # Only changes are queued, so the queue stays short however long a frame takes
+            if sample != lastSample:
+                self._samples.append((pygame.time.get_ticks(), *sample))
+                lastSample = sample
+
+            time.sleep(Mouse._refreshTime)
+
+        self._running = False
+
+    def update(self, events):
+        """ Update the mouse state for this frame
+
+        :param events: Use pygame.event.get()
+        :type events: list of pygame.event.Event
+        """
+        owner = threading.get_ident()
+        if self._owner is None:
+            self._owner = owner
+        elif self._owner != owner:
+            raise RuntimeError('The mouse state can only be updated by the thread that first updated it')
+
+        if not self.threaded:
+            Mouse.updateMouseState(events)
+            return
+
+        samples = []
+        while self._samples:
+            samples.append(self._samples.popleft())
+
+        Mouse._updateFromSamples(samples)
+
+
+Mouse._inputPump = InputPump()
+
+
 if __name__ == '__main__':
     pygame.init()
     win = pygame.display.set_mode((600, 600))
@@ -97,7 +358,8 @@ if __name__ == '__main__':
 
         win.fill((255, 255, 255))
 
-        Mouse.updateMouseState()
+        Mouse.pump(events)
+        print(Mouse.getMouseState(multiClick=True), Mouse.getMousePos())
 
         pygame.display.update()
         time.sleep(0.1)
@@ -1,12 +1,30 @@
 import pygame
-import tkinter as tk
-from tkinter import messagebox
 from enum import Enum
 
 import pygame_widgets
-from pygame_widgets.widget import WidgetBase
+from pygame_widgets.font import FontRegistry
+from pygame_widgets.widget import WidgetBase, WidgetHandler
+from pygame_widgets.button import Button
 
-tk.Tk().wm_withdraw()
+# Hidden Tk root window, created the first time a popup is shown
+_root = None
+
+
+def getMessagebox():
+    """Import tkinter and create its hidden root window on first use, as this is slow and most apps never need it
+
+    :return: The tkinter.messagebox module
+    """
+    global _root
+
+    import tkinter as tk
+    from tkinter import messagebox
+
+    if _root is None:
+        _root = tk.Tk()
+        _root.wm_withdraw()
+
+    return messagebox
 
 
 class PopupType(Enum):
@@ -20,9 +38,44 @@ class PopupType(Enum):
     RETRY_CANCEL = 7
 
 
+# Buttons of each type of popup as (text, result), matching the values returned by tkinter.messagebox
+BUTTONS = {
+    PopupType.INFO: (('OK', 'ok'),),
+    PopupType.ERROR: (('OK', 'ok'),),
+    PopupType.WARNING: (('OK', 'ok'),),
+    PopupType.QUESTION: (('Yes', 'yes'), ('No', 'no')),
+    PopupType.OK_CANCEL: (('OK', True), ('Cancel', False)),
+    PopupType.YES_NO: (('Yes', True), ('No', False)),
+    PopupType.YES_NO_CANCEL: (('Yes', True), ('No', False), ('Cancel', None)),
+    PopupType.RETRY_CANCEL: (('Retry', True), ('Cancel', False)),
+}
+
+
 class Popup(WidgetBase):
     def __init__(self, win: pygame.Surface, x: int, y: int, width: int, height: int, popupType: PopupType,
                  title: str, text: str, trigger=lambda *args: None, *buttons, **kwargs):
+        """ A modal dialog drawn on the window. It does not block the main loop: the result is passed to onResult
+        when a button is pressed and can also be polled with getResult
+
+        :param win: Surface on which to draw
+        :type win: pygame.Surface
+        :param x: X-coordinate of top left
+        :type x: int
+        :param y: Y-coordinate of top left
+        :type y: int
+        :param width: Width of popup
+        :type width: int
+        :param height: Height of popup
+        :type height: int
+        :param popupType: Decides the buttons shown and the possible results
+        :type popupType: PopupType
+        :param title: Title of the popup
+        :type title: str
+        :param text: Message of the popup
+        :type text: str
+        :param trigger: Function checked every frame, showing the popup when it returns True
+        :param kwargs: Optional parameters
+        """
         super().__init__(win, x, y, width, height)
         self.popupType = popupType
         self.title = title
@@ -34,12 +87,12 @@ class Popup(WidgetBase):
 
         self.titleColour = kwargs.get('titleColour', (0, 0, 0))
         self.titleSize = kwargs.get('titleSize', 40)
-        self.titleFont = kwargs.get('titleFont', pygame.font.SysFont('calibri', self.titleSize, True))
+        self.titleFont = kwargs.get('titleFont') or FontRegistry.getFont('calibri', self.titleSize, True)
         self.titleRect = self.alignTitleRect()
 
         self.textColour = kwargs.get('textColour', (0, 0, 0))
         self.textSize = kwargs.get('textSize', 18)
-        self.textFont = kwargs.get('textFont', pygame.font.SysFont('calibri', self.textSize))
+        self.textFont = kwargs.get('textFont') or FontRegistry.getFont('calibri', self.textSize)
         self.textRect = self.alignTextRect()
 
         self.radius = kwargs.get('radius', 0)
@@ -48,7 +101,21 @@ class Popup(WidgetBase):
         self.shadowDistance = kwargs.get('shadowDistance', 0)
         self.shadowColour = kwargs.get('shadowColour', (210, 210, 180))
 
+        # Drawn over the rest of the window while the popup is shown. None to leave it as it is
+        self.overlayColour = kwargs.get('overlayColour', (0, 0, 0, 100))
+
+        # Use blocking tkinter message boxes instead of drawing on the window
+        self.useTkinter = kwargs.get('useTkinter', False)
+
+        # Function
+        self.onResult = kwargs.get('onResult', lambda *args: None)
+        self.onResultParams = kwargs.get('onResultParams', ())
+
+        self.dialogButtons = self.createButtons(**kwargs)
+
         self.result = None
+        self._surface = None
+        self._overlay = None
 
         self.hide()
 
@@ -60,23 +127,142 @@ class Popup(WidgetBase):
         return pygame.Rect(self._x + self.margin, self._y + self._height // 3,
                            self._width - self.margin * 2, self._height // 2 - self.margin * 2)
 
+    def createButtons(self, **kwargs):
+        """Create a button for each possible result along the bottom of the popup"""
+        choices = BUTTONS[self.popupType]
+
+        height = self._height // 6
+        width = (self._width - self.margin * (len(choices) + 1)) // len(choices)
+        y = self._y + self._height - self.margin - height
+
+        buttons = []
+        for i, (text, result) in enumerate(choices):
+            buttons.append(Button(
+                self.win, self._x + self.margin + i * (width + self.margin), y, width, height, isSubWidget=True,
+                text=text, font=self.textFont, textColour=kwargs.get('buttonTextColour', self.textColour),
+                inactiveColour=kwargs.get('buttonColour', (220, 220, 220)),
+                hoverColour=kwargs.get('buttonHoverColour', (200, 200, 200)),
+                pressedColour=kwargs.get('buttonPressedColour', (180, 180, 180)),
+                radius=kwargs.get('buttonRadius', self.radius // 2),
+                onRelease=self.close, onReleaseParams=(result,)
+            ))
+
+        return buttons
+
     def listen(self, events):
-        if self.trigger():
-            self.show()
-            messagebox.showinfo(self.title, self.text)
+        if self._hidden:
+            if self.trigger():
+                self.show()
+            return
+
+        if not self._disabled and not self.useTkinter:
+            for button in self.dialogButtons:
+                button.listen(events)
+
+            for event in events:
+                if event.type == pygame.KEYDOWN:
+                    # Enter chooses the first button and escape the last, e.g. Yes and Cancel
+                    if event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
+                        self.close(BUTTONS[self.popupType][0][1])
+                    elif event.key == pygame.K_ESCAPE:
+                        self.close(BUTTONS[self.popupType][-1][1])
+
+    def contains(self, x, y):
+        # Widgets beneath the popup cannot be used while it is shown
+        return not self._hidden and not self.useTkinter
+
+    def getBoundingRect(self):
+        # Contains every point, and the overlay covers the whole window
+        offsetX, offsetY = self.win.get_abs_offset()
+        return self.win.get_rect().move(offsetX, offsetY)
+
+    def render(self):
+        """Draw everything except the buttons onto a surface the size of the popup and its shadow"""
+        surface = pygame.Surface(
+            (self._width + self.shadowDistance, self._height + self.shadowDistance), pygame.SRCALPHA
+        )
+
+        if self.shadowDistance:
+            pygame.draw.rect(
+                surface, self.shadowColour,
+                (self.shadowDistance, self.shadowDistance, self._width, self._height),
+                border_radius=self.radius
+            )
+        pygame.draw.rect(surface, self.colour, (0, 0, self._width, self._height), border_radius=self.radius)
+
+        offset = (-self._x, -self._y)
+
+        title = self.titleFont.render(self.title, True, self.titleColour)
+        surface.blit(title, title.get_rect(center=self.titleRect.move(offset).center))
+
+        y = self.textRect.top - self._y
+        for line in self.wrapText():
+            rendered = self.textFont.render(line, True, self.textColour)
+            surface.blit(rendered, rendered.get_rect(centerx=self.textRect.centerx - self._x, top=y))
+            y += self.textFont.get_linesize()
+
+        return surface
+
+    def wrapText(self):
+        """Split the text into lines that fit in the text rectangle"""
+        lines = []
+        for paragraph in self.text.split('\n'):
+            line = ''
+            for word in paragraph.split(' '):
+                candidate = f'{line} {word}' if line else word
+                if line and self.textFont.size(candidate)[0] > self.textRect.width:
+                    lines.append(line)
+                    line = word
+                else:
+                    line = candidate
+            lines.append(line)
+
+        return lines
 
     def draw(self):
-        pass
+        if not self._hidden and not self.useTkinter:
+            if self.overlayColour is not None:
+                if self._overlay is None or self._overlay.get_size() != self.win.get_size():
+                    self._overlay = pygame.Surface(self.win.get_size(), pygame.SRCALPHA)
+                    self._overlay.fill(self.overlayColour)
+                self.win.blit(self._overlay, (0, 0))
+
+            if self._surface is None:
+                self._surface = self.render()
+            self.win.blit(self._surface, (self._x, self._y))
+
+            for button in self.dialogButtons:
+                button.draw()
+
+    def isDirty(self):
+        return self._dirty or any(button.isDirty() for button in self.dialogButtons)
+
+    def markClean(self):
+        super().markClean()
+        for button in self.dialogButtons:
+            button.markClean()
 
     def show(self):
+        """Open the popup. Unless useTkinter is set, this returns immediately and the popup stays open until one of
+        its buttons is pressed
+        """
         super().show()
+        self.result = None
+        self._surface = None
+        WidgetHandler.updateWidget(self)
+
+        if self.useTkinter:
+            self.showTkinter()
+
+    def showTkinter(self):
+        messagebox = getMessagebox()
         match self.popupType:
             case PopupType.INFO:
-                messagebox.showinfo(self.title, self.text)
+                self.result = messagebox.showinfo(self.title, self.text)
             case PopupType.ERROR:
-                messagebox.showerror(self.title, self.text)
+                self.result = messagebox.showerror(self.title, self.text)
             case PopupType.WARNING:
-                messagebox.showwarning(self.title, self.text)
+                self.result = messagebox.showwarning(self.title, self.text)
             case PopupType.QUESTION:
                 self.result = messagebox.askquestion(self.title, self.text)
             case PopupType.OK_CANCEL:
@@ -88,17 +274,31 @@ class Popup(WidgetBase):
             case PopupType.RETRY_CANCEL:
                 self.result = messagebox.askretrycancel(self.title, self.text)
 
+        self.hide()
+        self.onResult(self.result, *self.onResultParams)
+
+    def close(self, result):
+        """ Hide the popup with a result, as if the button for that result was pressed
+
+        :param result: The result, e.g. True for the Yes button of a YES_NO popup
+        """
+        self.result = result
+        self.hide()
+        WidgetHandler.updateWidget(self)
+        self.onResult(self.result, *self.onResultParams)
+
+    def isOpen(self):
+        return not self._hidden
+
     def getResult(self):
         return self.result
 
 
 if __name__ == '__main__':
-    from pygame_widgets.button import Button
-
-    def setButtonColour():
-        if popup.getResult():
+    def setButtonColour(result):
+        if result:
             button.setInactiveColour('green')
-        elif popup.getResult() == False:
+        elif result is False:
             button.setInactiveColour('red')
 
     pygame.init()
@@ -106,7 +306,7 @@ if __name__ == '__main__':
 
     popup = Popup(win, 100, 100, 400, 400, PopupType.YES_NO, 'Popup',
                   'This is the text in the popup. Would you like to continue? The buttons below can be customised.',
-                  radius=20, textSize=20)
+                  radius=20, textSize=20, shadowDistance=5, onResult=setButtonColour)
 
     button = Button(win, 100, 100, 400, 400, text='Popup', onClick=popup.show)
 
@@ -123,4 +323,3 @@ if __name__ == '__main__':
 
         pygame_widgets.update(events)
         pygame.display.update()
-        setButtonColour()
@@ -0,0 +1,432 @@
+import bisect
+import time
+import weakref
+from collections import deque
+
+import pygame
+
+from pygame_widgets.mouse import Mouse
+from pygame_widgets.font import FontRegistry
+from pygame_widgets.widget import WidgetBase, WidgetHandler
+
+
+class Profiler:
+    def __init__(self, window=120):
+        """ Records the time each widget spends listening and drawing over the last few frames.
+        Pass to WidgetHandler.enableProfiling to start recording
+
+        :param window: Number of frames kept for the statistics
+        :type window: int
+        """
+        self.window = window
+        self.reset()
+
+    def reset(self):
+        self._frames = deque(maxlen=self.window)  # [(listen ns, draw ns, contains calls)]
+        self._widgets = {}  # {id(widget): (weakref.ref(widget), deque of listen ns, deque of draw ns)}
+        self._classes = {}  # {class name: (deque of listen ns, deque of draw ns)}
+
+        self._frameListen = {}  # {id(widget): ns} for the current frame
+        self._frameDraw = {}
+        self._frameContains = 0
+
+    def listen(self, widget, events):
+        start = time.perf_counter_ns()
+        widget.listen(events)
+        self._frameListen[id(widget)] = self._frameListen.get(id(widget), 0) + time.perf_counter_ns() - start
+
+    def draw(self, widget):
+        start = time.perf_counter_ns()
+        widget.draw()
+        self._frameDraw[id(widget)] = self._frameDraw.get(id(widget), 0) + time.perf_counter_ns() - start
+
+    def countContains(self, calls=1):
+        self._frameContains += calls
+
+    def endFrame(self, widgets):
+        """ Add the current frame to the statistics
+
+        :param widgets: The widgets updated this frame
+        """
+        classes = {}
+        for widget in widgets:
+            key = id(widget)
+            listenTime = self._frameListen.get(key, 0)
+            drawTime = self._frameDraw.get(key, 0)
+
+            if key not in self._widgets:
+                self._widgets[key] = (
+                    weakref.ref(widget, lambda _, key=key: self._widgets.pop(key, None)),
+                    deque(maxlen=self.window),
+                    deque(maxlen=self.window)
+                )
+            _, listenTimes, drawTimes = self._widgets[key]
+            listenTimes.append(listenTime)
+            drawTimes.append(drawTime)
+
+            total = classes.setdefault(type(widget).__name__, [0, 0])
+            total[0] += listenTime
+            total[1] += drawTime
+
+        for name, (listenTime, drawTime) in classes.items():
+            if name not in self._classes:
+                self._classes[name] = (deque(maxlen=self.window), deque(maxlen=self.window))
+            self._classes[name][0].append(listenTime)
+            self._classes[name][1].append(drawTime)
+
+        self._frames.append((sum(self._frameListen.values()), sum(self._frameDraw.values()), self._frameContains))
+
+        self._frameListen = {}
+        self._frameDraw = {}
+        self._frameContains = 0
+
+    @staticmethod
+    def summarise(times, scale=1e-6):
+        """ Rolling statistics of some samples
+
+        :param times: Samples, in nanoseconds for times
+        :param scale: Multiplier applied to the results, converting nanoseconds to milliseconds by default
+        :return: Mean, median, 95th and 99th percentiles and maximum
+        :rtype: dict
+        """
+        if not times:
+            return {'mean': 0, 'p50': 0, 'p95': 0, 'p99': 0, 'max': 0}
+
+        times = sorted(times)
+        return {
+            'mean': sum(times) / len(times) * scale,
+            'p50': times[len(times) // 2] * scale,
+            'p95': times[min(len(times) - 1, int(len(times) * 0.95))] * scale,
+            'p99': times[min(len(times) - 1, int(len(times) * 0.99))] * scale,
+            'max': times[-1] * scale,
+        }
+
+    def getFrameStats(self):
+        """ Time spent listening and drawing in milliseconds and the number of contains calls made by the
+        WidgetHandler per frame
+
+        :rtype: dict
+        """
+        return {
+            'frames': len(self._frames),
+            'listen': self.summarise([frame[0] for frame in self._frames]),
+            'draw': self.summarise([frame[1] for frame in self._frames]),
+            'contains': self.summarise([frame[2] for frame in self._frames], scale=1),
+        }
+
+    def getWidgetStats(self, widget):
+        """ Time spent by a widget listening and drawing in milliseconds per frame
+
+        :rtype: dict
+        """
+        if id(widget) not in self._widgets:
+            return None
+
+        _, listenTimes, drawTimes = self._widgets[id(widget)]
+        return {'listen': self.summarise(listenTimes), 'draw': self.summarise(drawTimes)}
+
+    def getClassStats(self):
+        """ Time spent by all widgets of each class listening and drawing in milliseconds per frame
+
+        :return: {class name: stats}
+        :rtype: dict
+        """
+        return {
+            name: {'listen': self.summarise(listenTimes), 'draw': self.summarise(drawTimes)}
+            for name, (listenTimes, drawTimes) in self._classes.items()
+        }
+
+    def getTopWidgets(self, n=5, phase='total', statistic='p95'):
+        """ The widgets taking the most time
+
+        :param n: Number of widgets
+        :param phase: 'listen', 'draw' or 'total'
+        :param statistic: Statistic compared, one of 'mean', 'p50', 'p95', 'p99' or 'max'
+        :return: [(widget, milliseconds)] slowest first
+        :rtype: list
+        """
+        times = []
+        for ref, listenTimes, drawTimes in list(self._widgets.values()):
+            widget = ref()
+            if widget is None:
+                continue
+
+            if phase == 'listen':
+                samples = listenTimes
+            elif phase == 'draw':
+                samples = drawTimes
+            else:
+                samples = [listenTime + drawTime for listenTime, drawTime in zip(listenTimes, drawTimes)]
+
+            times.append((widget, self.summarise(samples)[statistic]))
+
+        times.sort(key=lambda item: item[1], reverse=True)
+        return times[:n]
+
+
+class Histogram:
+    # Upper bounds of the buckets in milliseconds, the last bucket holds anything slower
+    BOUNDS = (1, 2, 4, 8, 16, 33, 50, 100, 200, 500)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BOUNDS) + 1)
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def add(self, milliseconds):
+        self.counts[bisect.bisect_left(self.BOUNDS, milliseconds)] += 1
+        self.count += 1
+        self.total += milliseconds
+        self.max = max(self.max, milliseconds)
+
+    def percentile(self, percent):
+        """Upper bound of the bucket holding the percentile, or the maximum if that is in the last bucket"""
+        target = self.count * percent / 100
+        seen = 0
+        for bound, count in zip(self.BOUNDS, self.counts):
+            seen += count
+            if seen >= target and seen:
+                return bound
+
+        return self.max
+
+    def getStats(self):
+        """ Summary of the samples
+
+        :return: The number of samples, mean, median, 95th percentile and maximum in milliseconds, and the number
+            of samples in each bucket by its upper bound
+        :rtype: dict
+        """
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else 0,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'max': self.max,
+            'buckets': dict(zip([*self.BOUNDS, float('inf')], self.counts)),
+        }
+
+
+class LatencyTracker:
+    # Callbacks recorded as the response of a widget to input
+    CALLBACKS = ('onClick', 'onRelease', 'onTextChanged', 'onSubmit', 'onSelected', 'onResult')
+
+    def __init__(self):
+        """ Measures the time from input reaching pygame_widgets.update to the callback of the widget handling it,
+        to the end of the draw that follows and to the next update, after the frame has been shown.
+        Pass to WidgetHandler.enableLatencyTracking to start measuring
+        """
+        self.active = False
+        self._pending = []  # Widgets added to the WidgetHandler since the last frame, instrumented once it starts
+        self._originals = {}  # {id(widget): (weakref.ref(widget), {name: callback})} callbacks that were wrapped
+        self.reset()
+
+    def reset(self):
+        self._histograms = {}  # {class name: {stage: Histogram}}
+        self._inputTime = None
+        self._responses = []  # [(class name, ns)] callbacks fired this frame
+        self._drawn = []  # [(class name, input ns)] responses drawn last frame, waiting for the next update
+
+    def _getHistogram(self, className, stage):
+        stages = self._histograms.setdefault(className, {})
+        if stage not in stages:
+            stages[stage] = Histogram()
+
+        return stages[stage]
+
+    def track(self, widget):
+        """Instrument a widget at the start of the next frame, once it has been fully created"""
+        self._pending.append(widget)
+
+    def instrument(self, widget, owner=None):
+        """ Wrap the callbacks of a widget to record when they fire. Done automatically, once, for every widget in
+        the WidgetHandler and their buttons. Call again after replacing a callback for the new one to be recorded
+
+        :param widget: The widget
+        :param owner: Widget whose class the callbacks are recorded under, the widget itself by default
+        """
+        className = type(owner or widget).__name__
+        for name in self.CALLBACKS:
+            callback = getattr(widget, name, None)
+            if callback is None or getattr(callback, 'latencyTracker', None) is self:
+                continue
+
+            ref, originals = self._originals.get(id(widget), (None, None))
+            if ref is None or ref() is not widget:
+                key = id(widget)
+                ref, originals = weakref.ref(widget, lambda _, key=key: self._originals.pop(key, None)), {}
+                self._originals[key] = (ref, originals)
+
+            originals[name] = callback
+            setattr(widget, name, self._wrap(className, callback))
+
+        for button in getattr(widget, 'buttons', ()):
+            if isinstance(button, WidgetBase):
+                self.instrument(button, owner or widget)
+
+    def restore(self):
+        """Put back the callbacks that were wrapped, unless they have been replaced since"""
+        for ref, originals in list(self._originals.values()):
+            widget = ref()
+            if widget is not None:
+                for name, callback in originals.items():
+                    if getattr(getattr(widget, name, None), 'latencyTracker', None) is self:
+                        setattr(widget, name, callback)
+
+        self._originals = {}
+        self._pending = []
+
+    def _wrap(self, className, callback):
+        def tracked(*args, **kwargs):
+            if self.active:
+                self._responses.append((className, time.perf_counter_ns()))
+            return callback(*args, **kwargs)
+
+        tracked.latencyTracker = self
+        return tracked
+
+    def startFrame(self):
+        """Record the responses shown by the last frame, timestamp the input of this one and instrument the widgets
+        added since the last"""
+        now = time.perf_counter_ns()
+        for className, inputTime in self._drawn:
+            self._getHistogram(className, 'frame').add((now - inputTime) / 1e6)
+        self._drawn = []
+
+        # Input queued by Mouse happened before this update
+        inputTimestamp = Mouse.getInputTimestamp()
+        age = max(0, pygame.time.get_ticks() - inputTimestamp) if inputTimestamp is not None else 0
+        self._inputTime = now - age * 1_000_000
+
+        self._responses = []
+        pending, self._pending = self._pending, []
+        for widget in pending:
+            self.instrument(widget)
+
+    def endFrame(self):
+        """Record the responses of this frame once their widgets have been drawn"""
+        now = time.perf_counter_ns()
+        for className, responseTime in self._responses:
+            self._getHistogram(className, 'callback').add((responseTime - self._inputTime) / 1e6)
+            self._getHistogram(className, 'draw').add((now - self._inputTime) / 1e6)
+            self._drawn.append((className, self._inputTime))
+
+        self._responses = []
+
+    def getHistograms(self):
+        """ Latency of the responses of each class of widget at each stage: 'callback' when the callback fired,
+        'draw' when the frame had been drawn and 'frame' when the next update started, after the frame was shown
+
+        :return: {class name: {stage: Histogram.getStats()}}
+        :rtype: dict
+        """
+        return {
+            className: {stage: histogram.getStats() for stage, histogram in stages.items()}
+            for className, stages in self._histograms.items()
+        }
+
+
+class ProfilerOverlay(WidgetBase):
+    def __init__(self, win, x, y, width, height, profiler, **kwargs):
+        """ Shows the frame statistics and the slowest widgets of a profiler
+
+        :param win: Surface on which to draw
+        :type win: pygame.Surface
+        :param x: X-coordinate of top left
+        :type x: int
+        :param y: Y-coordinate of top left
+        :type y: int
+        :param width: Width of overlay
+        :type width: int
+        :param height: Height of overlay
+        :type height: int
+        :param profiler: The profiler to show
+        :type profiler: Profiler
+        :param kwargs: Optional parameters
+        """
+        super().__init__(win, x, y, width, height)
+
+        self.profiler = profiler
+        self.topWidgets = kwargs.get('topWidgets', 5)
+        self.refreshFrames = kwargs.get('refreshFrames', 30)  # Frames between updates of the text
+
+        self.colour = kwargs.get('colour', (0, 0, 0, 180))
+        self.textColour = kwargs.get('textColour', (255, 255, 255))
+        self.fontSize = kwargs.get('fontSize', 16)
+        self.font = kwargs.get('font') or FontRegistry.getFont('consolas', self.fontSize)
+
+        self._frame = 0
+        self._surface = None
+
+    def listen(self, events):
+        pass
+
+    def contains(self, x, y):
+        # Widgets beneath the overlay can still be used
+        return False
+
+    def isDirty(self):
+        return True
+
+    def getLines(self):
+        stats = self.profiler.getFrameStats()
+        lines = [
+            f'listen {stats["listen"]["mean"]:.2f}ms (p95 {stats["listen"]["p95"]:.2f}ms)',
+            f'draw {stats["draw"]["mean"]:.2f}ms (p95 {stats["draw"]["p95"]:.2f}ms)',
+            f'contains {stats["contains"]["mean"]:.0f} per frame',
+        ]
+        for widget, milliseconds in self.profiler.getTopWidgets(self.topWidgets):
+            lines.append(f'{milliseconds:.3f}ms {widget!r}')
+
+        return lines
+
+    def render(self):
+        surface = pygame.Surface((self._width, self._height), pygame.SRCALPHA)
+        surface.fill(self.colour)
+
+        y = 2
+        for line in self.getLines():
+            surface.blit(self.font.render(line, True, self.textColour), (4, y))
+            y += self.font.get_linesize()
+
+        return surface
+
+    def draw(self):
+        if not self._hidden:
+            if self._surface is None or self._frame % self.refreshFrames == 0:
+                self._surface = self.render()
+            self._frame += 1
+
+            self.win.blit(self._surface, (self._x, self._y))
+
+
+if __name__ == '__main__':
+    import pygame_widgets
+    from pygame_widgets.button import Button
+
+    pygame.init()
+    win = pygame.display.set_mode((800, 600))
+
+    profiler = Profiler()
+    WidgetHandler.enableProfiling(profiler)
+
+    buttons = [
+        Button(win, 20 + 80 * (i % 9), 200 + 50 * (i // 9), 70, 40, text=str(i), radius=5)
+        for i in range(72)
+    ]
+    overlay = ProfilerOverlay(win, 0, 0, 800, 150, profiler)
+
+    run = True
+    while run:
+        events = pygame.event.get()
+        for event in events:
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                run = False
+                quit()
+
+        win.fill((255, 255, 255))
+
+        pygame_widgets.update(events)
+        pygame.display.update()
@@ -24,6 +24,13 @@ class ProgressBar(WidgetBase):
     def listen(self, events):
         pass
 
+    def isDirty(self):
+        return self._dirty or min(max(self.progress(), 0), 1) != self.percent
+
+    def getBoundingRect(self):
+        # Curved ends are drawn outside of the widget's rectangle
+        return super().getBoundingRect().inflate(int(self.radius) * 2, 0)
+
     def draw(self):
         """ Display to surface """
         self.percent = min(max(self.progress(), 0), 1)
@@ -0,0 +1,125 @@
+import bisect
+import heapq
+import itertools
+import sys
+
+
+class SearchIndex:
+    # Joins the choices so that they can be searched together. Cannot be typed into a TextBox
+    SEPARATOR = '\0'
+
+    def __init__(self, choices, maxResults=None):
+        """ An index of choices that finds those starting with or containing some text without checking every choice.
+        Results are in the same order as ComboBox's default search: choices starting with the text, then choices
+        containing it, each in their original order
+
+        :param choices: Possible search values
+        :type choices: iterable of str
+        :param maxResults: The maximum number of results to return, or None for all of them
+        :type maxResults: int
+        """
+        self.maxResults = maxResults
+        self.setChoices(choices)
+
+    def setChoices(self, choices):
+        # A copy, so that changes made to the list the index was built from can be detected
+        self._choices = list(choices)
+
+        # Choices starting with the same text are next to each other when sorted
+        self._sortedIndices = sorted(range(len(self._choices)), key=self._choices.__getitem__)
+        self._sortedChoices = [self._choices[i] for i in self._sortedIndices]
+
+        # Choices containing some text are found by searching every choice at once
+        self._text = self.SEPARATOR.join(self._choices)
+        self._starts = list(itertools.accumulate((len(choice) + 1 for choice in self._choices[:-1]), initial=0))
+
+        # Every choice containing the last search text, used to narrow down the next search
+        self._lastText = None
+        self._lastMatches = None
+
+    def __call__(self, text, choices=None):
+        return self.search(text, choices)
+
+    def search(self, text, choices=None):
+        """ Find the choices starting with or containing the text
+
+        :param text: The search text
+        :type text: str
+        :param choices: The choices to search. The index is rebuilt if they differ from those it was built from,
+            including when the same list has been edited
+        :return: The matching choices
+        :rtype: list of str
+        """
+        if choices is not None and self.isStale(choices):
+            self.setChoices(choices)
+
+        limit = len(self._choices) if self.maxResults is None else self.maxResults
+        if limit <= 0 or not self._choices:
+            return []
+
+        start, end = 0, len(self._choices)
+        if text:
+            start = bisect.bisect_left(self._sortedChoices, text)
+            if ord(text[-1]) < sys.maxunicode:
+                end = bisect.bisect_left(self._sortedChoices, text[:-1] + chr(ord(text[-1]) + 1))
+
+        prefixMatches = heapq.nsmallest(limit, self._sortedIndices[start:end])
+
+        substringMatches = []
+        if len(prefixMatches) < limit:
+            substringMatches = list(itertools.islice(
+                (i for i in self._getMatches(text) if not self._choices[i].startswith(text)),
+                limit - len(prefixMatches)
+            ))
+
+        return [self._choices[i] for i in prefixMatches + substringMatches]
+
+    def isStale(self, choices):
+        """ Whether the choices differ from those the index was built from. Unchanged strings are compared by
+        identity first, so this is much faster than searching them
+
+        :param choices: The choices
+        :type choices: iterable of str
+        :rtype: bool
+        """
+        if not isinstance(choices, list):
+            choices = list(choices)
+        return choices != self._choices
+
+    def _getMatches(self, text):
+        """Indices of the choices containing the text in ascending order"""
+        if self._lastText is not None and self._lastText in text:
+            # Anything containing the text also contains the previous text
+            return self._narrowMatches(text, self._lastMatches)
+
+        return self._findMatches(text)
+
+    def _narrowMatches(self, text, previous):
+        """Lazily narrow down the choices containing the previous text, so the search can stop once there are enough"""
+        matches = []
+
+        for index in previous:
+            if text in self._choices[index]:
+                matches.append(index)
+                yield index
+
+        self._lastText = text
+        self._lastMatches = matches
+
+    def _findMatches(self, text):
+        """Lazily find the choices containing the text, so the search can stop once there are enough"""
+        matches = []
+
+        position = self._text.find(text)
+        while position != -1:
+            index = bisect.bisect_right(self._starts, position) - 1
+            matches.append(index)
+            yield index
+
+            if index + 1 == len(self._starts):
+                break
+            position = self._text.find(text, self._starts[index + 1])
+
+        # Only complete results can be narrowed down by the next search
+        self._lastText = text
+        self._lastMatches = matches
@@ -2,11 +2,110 @@ import pygame
 import math
 
 import pygame_widgets
+from pygame_widgets.font import FontRegistry, TextCache
 from pygame_widgets.widget import WidgetBase
 from pygame_widgets.mouse import Mouse, MouseState
 
 
+def drawRows(surface, rows, rowHeight, colour1, colour2, radius, first=0):
+    """ Draw the alternating row backgrounds of a list onto a surface the size of the list, rounding the corners of
+    the first and last rows
+
+    :param surface: Surface of the list
+    :type surface: pygame.Surface
+    :param rows: Number of rows
+    :type rows: int
+    :param rowHeight: Height of each row
+    :type rowHeight: int
+    :param colour1: Colour of even rows
+    :param colour2: Colour of odd rows
+    :param radius: Radius of the corners
+    :type radius: int
+    :param first: Index of the item in the first row, so that colours stay with their items when scrolled
+    :type first: int
+    """
+    width = surface.get_width()
+    for row in range(rows):
+        colour = colour1 if not (first + row) % 2 else colour2
+        rect = (0, rowHeight * row, width, rowHeight)
+        if pygame.version.vernum[0] < 2:
+            pygame.draw.rect(surface, colour, rect)
+
+        elif row == 0:
+            pygame.draw.rect(
+                surface, colour, rect, border_top_left_radius=radius, border_top_right_radius=radius
+            )
+
+        elif row == rows - 1:
+            pygame.draw.rect(
+                surface, colour, rect, border_bottom_left_radius=radius, border_bottom_right_radius=radius
+            )
+
+        else:
+            pygame.draw.rect(surface, colour, rect)
+
+
+def createRowSurface(width, height, radius, colours):
+    """ Surface to draw the static parts of a list onto, filled with a colour key outside the rounded corners
+
+    :param width: Width of the list
+    :param height: Height of the list
+    :param radius: Radius of the corners
+    :param colours: Colours drawn onto the surface, which the colour key must not match
+    :return: The surface
+    :rtype: pygame.Surface
+    """
+    surface = pygame.Surface((width, height))
+    if radius:
+        colours = {pygame.Color(colour)[:3] for colour in colours}
+        key = next(key for key in ((255, 0, 255), (0, 255, 1), (1, 2, 3)) if key not in colours)
+        surface.fill(key)
+        surface.set_colorkey(key)
+    return surface
+
+
+def createCorners(surface, radius):
+    """ Copies of the strips of a row surface holding its rounded corners, the only parts that are not opaque, so
+    the rest of it can be blitted without checking the colour key
+
+    :param surface: Surface from createRowSurface
+    :param radius: Radius of the corners
+    :return: The strips and their y-coordinates on the surface
+    :rtype: list of (pygame.Surface, int)
+    """
+    if not radius:
+        return []
+
+    width, height = surface.get_size()
+    radius = min(radius, height // 2)
+    corners = []
+    for y in (0, height - radius):
+        strip = surface.subsurface((0, y, width, radius)).copy()
+        strip.set_colorkey(surface.get_colorkey())
+        corners.append((strip, y))
+    surface.set_colorkey(None)
+    return corners
+
+
+def blitRows(win, surface, corners, x, y):
+    """Blit a row surface and its corners from createCorners"""
+    if not corners:
+        win.blit(surface, (x, y))
+        return
+
+    top = corners[0][0].get_height()
+    win.blit(surface, (x, y + top), (0, top, surface.get_width(), surface.get_height() - 2 * top))
+    for strip, offset in corners:
+        win.blit(strip, (x, y + offset))
+
+
 class Checkbox(WidgetBase):
+    # Attributes the cached rows are drawn from, so clear them when assigned
+    CACHED_ATTRIBUTES = frozenset((
+        'items', 'visibleRows', '_scroll', '_width', '_height', 'radius', 'colour1', 'colour2', 'textColour', 'font',
+        'boxSize', 'boxThickness', 'boxColour'
+    ))
+
     def __init__(self, win, x, y, width, height, items, **kwargs):
         """ A list of buttons that allows multiple selections
 
@@ -28,7 +127,11 @@ class Checkbox(WidgetBase):
 
         self.items = items
         self.rows = len(items)
-        self.rowHeight = self._height // self.rows
+
+        # Number of rows shown at once, scrolling with the mouse wheel through the rest. All by default
+        self.visibleRows = kwargs.get('visibleRows', None)
+        self._scroll = 0
+        self.rowHeight = self._height // self.countVisibleRows()
         self.selected = [False for _ in range(self.rows)]
 
         # Border
@@ -37,7 +140,7 @@ class Checkbox(WidgetBase):
         self.radius = kwargs.get('radius', 0)
 
         # Checkbox
-        self.boxSize = int(kwargs.get('boxSize', self._height / self.rows // 3))
+        self.boxSize = int(kwargs.get('boxSize', self._height / self.countVisibleRows() // 3))
         self.boxThickness = kwargs.get('boxThickness', 3)
         self.boxColour = kwargs.get('boxColour', (0, 0, 0))
         # TODO: selected image (tick) / colour
@@ -52,17 +155,109 @@ class Checkbox(WidgetBase):
         # Text
         self.textColour = kwargs.get('textColour', (0, 0, 0))
         self.fontSize = kwargs.get('fontSize', 20)
-        self.font = kwargs.get('font', pygame.font.SysFont('calibri', self.fontSize))
-        self.texts = [self.font.render(self.items[row], True, self.textColour) for row in range(self.rows)]
-        self.textRects = self.createTextRects()
+        self.font = kwargs.get('font') or FontRegistry.getFont('calibri', self.fontSize)
 
         self.clicked = False
 
+        # Row backgrounds, labels and empty boxes, rebuilt when anything they depend on changes
+        self._surface = None
+        self._corners = []
+        self._origin = (self._x, self._y)  # Position the rows were laid out at
+        self.refresh()
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in self.CACHED_ATTRIBUTES:
+            super().__setattr__('_surface', None)
+
+    def setItems(self, items):
+        """Change the items. Assign a new sequence rather than editing the items in place, or call refresh after"""
+        self.items = items
+
+    def refresh(self):
+        """ Recreate the cached rows. Done automatically when the attributes in CACHED_ATTRIBUTES are assigned, call
+        it after editing the items in place
+        """
+        self._origin = (self._x, self._y)
+        self.rows = len(self.items)
+        visibleRows = self.countVisibleRows()
+        self.rowHeight = self._height // visibleRows
+        self._scroll = max(0, min(self._scroll, self.rows - visibleRows))
+        if len(self.selected) != self.rows:
+            self.selected = (self.selected + [False] * self.rows)[:self.rows]
+
+        self.texts = [
+            TextCache.render(self.font, self.items[self._scroll + row], True, self.textColour)
+            for row in range(visibleRows)
+        ]
+        self.textRects = self.createTextRects()
         self.boxes = self.createBoxLocations()
 
+        self._surface = createRowSurface(
+            self._width, self._height, self.radius, (self.colour1, self.colour2, self.textColour, self.boxColour)
+        )
+        drawRows(self._surface, visibleRows, self.rowHeight, self.colour1, self.colour2, self.radius, self._scroll)
+        for row in range(visibleRows):
+            box = self.boxes[row].move(-self._x, -self._y)
+            pygame.draw.rect(self._surface, self.boxColour, box, self.boxThickness)
+            self._surface.blit(self.texts[row], self.textRects[row].move(-self._x, -self._y))
+        self._corners = createCorners(self._surface, self.radius)
+        self.markDirty()
+
+    def updateCache(self):
+        """Recreate the cached rows if they have been cleared, and move the boxes and labels with the list"""
+        if self._surface is None:
+            self.refresh()
+
+        dx, dy = self._x - self._origin[0], self._y - self._origin[1]
+        if dx or dy:
+            self._origin = (self._x, self._y)
+            self.textRects = [rect.move(dx, dy) for rect in self.textRects]
+            self.boxes = [box.move(dx, dy) for box in self.boxes]
+
+    def countVisibleRows(self):
+        return self.rows if self.visibleRows is None else max(1, min(self.visibleRows, self.rows))
+
+    def getRowAt(self, x, y):
+        """ Index of the item in the row at a point, found from the row height rather than by testing every row
+
+        :param x: X-coordinate on win
+        :param y: Y-coordinate on win
+        :return: Index of the item, or None if the point is outside of the rows
+        :rtype: int or None
+        """
+        if not self._x <= x < self._x + self._width or y < self._y:
+            return None
+
+        row = (y - self._y) // self.rowHeight
+        if row >= self.countVisibleRows():
+            return None
+        return self._scroll + row
+
+    def getScroll(self):
+        return self._scroll
+
+    def setScroll(self, scroll):
+        """ Scroll the list so that the item at the given index is shown first. Only has an effect when visibleRows
+        is set and there are more items than that
+
+        :param scroll: Index of the first item shown
+        :type scroll: int
+        """
+        scroll = max(0, min(scroll, self.rows - self.countVisibleRows()))
+        if scroll != self._scroll:
+            self._scroll = scroll
+            self.markDirty()
+
+    def _scrollRows(self, events):
+        if self.visibleRows is not None:
+            for event in events:
+                if event.type == pygame.MOUSEWHEEL:
+                    self.setScroll(self._scroll - event.y)
+
     def createTextRects(self):
         textRects = []
-        for row in range(self.rows):
+        for row in range(len(self.texts)):
             textRects.append(
                 self.texts[row].get_rect(
                     center=(
@@ -76,7 +271,7 @@ class Checkbox(WidgetBase):
 
     def createBoxLocations(self):
         boxes = []
-        for row in range(self.rows):
+        for row in range(self.countVisibleRows()):
             boxes.append(pygame.Rect(
                 self._x + self.boxSize,
                 self._y + self.rowHeight * row + self.boxSize,
@@ -95,52 +290,37 @@ class Checkbox(WidgetBase):
             x, y = Mouse.getMousePos()
 
             if self.contains(x, y):
+                self._scrollRows(events)
                 if mouseState == MouseState.CLICK:
-                    for row in range(self.rows):
-                        if self.boxes[row].collidepoint(x, y):
-                            self.selected[row] = not self.selected[row]
+                    self.updateCache()
+                    offsetX, offsetY = self.win.get_abs_offset()
+                    x, y = x - offsetX, y - offsetY
+                    row = self.getRowAt(x, y)
+                    if row is not None and self.boxes[row - self._scroll].collidepoint(x, y):
+                        self.selected[row] = not self.selected[row]
+                        self.markDirty()
 
     def draw(self):
         """ Display to surface """
         if not self._hidden:
-            for row in range(self.rows):
-                colour = self.colour1 if not row % 2 else self.colour2
-                if pygame.version.vernum[0] < 2:
-                    pygame.draw.rect(
-                        self.win, colour, (self._x, self._y + self.rowHeight * row, self._width, self.rowHeight)
-                    )
-                else:
-                    if row == 0:
-                        pygame.draw.rect(
-                            self.win, colour, (self._x, self._y + self.rowHeight * row, self._width, self.rowHeight),
-                            border_top_left_radius=self.radius, border_top_right_radius=self.radius
-                        )
-
-                    elif row == self.rows - 1:
-                        pygame.draw.rect(
-                            self.win, colour, (self._x, self._y + self.rowHeight * row, self._width, self.rowHeight),
-                            border_bottom_left_radius=self.radius, border_bottom_right_radius=self.radius
-                        )
-
-                    else:
-                        pygame.draw.rect(
-                            self.win, colour, (self._x, self._y + self.rowHeight * row, self._width, self.rowHeight)
-                        )
-
-                width = 0 if self.selected[row] else self.boxThickness
-                pygame.draw.rect(
-                    self.win, self.boxColour,
-                    self.boxes[row],
-                    width
-                )
+            self.updateCache()
+            blitRows(self.win, self._surface, self._corners, self._x, self._y)
 
-                self.win.blit(self.texts[row], self.textRects[row])
+            for row, box in enumerate(self.boxes):
+                if self.selected[self._scroll + row]:
+                    pygame.draw.rect(self.win, self.boxColour, box)
 
     def getSelected(self):
         return [self.items[row] for row in range(self.rows) if self.selected[row]]
 
 
 class Radio(WidgetBase):
+    # Attributes the cached rows are drawn from, so clear them when assigned
+    CACHED_ATTRIBUTES = frozenset((
+        'items', 'visibleRows', '_scroll', '_width', '_height', 'radius', 'colour1', 'colour2', 'textColour', 'font',
+        'circleRadius', 'circleThickness', 'circleColour'
+    ))
+
     def __init__(self, win, x, y, width, height, items, **kwargs):
         """ A list of buttons that allows a single selections
 
@@ -162,7 +342,11 @@ class Radio(WidgetBase):
 
         self.items = items
         self.rows = len(items)
-        self.rowHeight = self._height // self.rows
+
+        # Number of rows shown at once, scrolling with the mouse wheel through the rest. All by default
+        self.visibleRows = kwargs.get('visibleRows', None)
+        self._scroll = 0
+        self.rowHeight = self._height // self.countVisibleRows()
         self.selected = kwargs.get('default', 0)
 
         # Border
@@ -171,7 +355,7 @@ class Radio(WidgetBase):
         self.radius = kwargs.get('radius', 0)
 
         # Radio
-        self.circleRadius = int(kwargs.get('circleRadius', self._height / self.rows // 6))
+        self.circleRadius = int(kwargs.get('circleRadius', self._height / self.countVisibleRows() // 6))
         self.circleThickness = kwargs.get('circleThickness', 3)
         self.circleColour = kwargs.get('circleColour', (0, 0, 0))
 
@@ -185,17 +369,109 @@ class Radio(WidgetBase):
         # Text
         self.textColour = kwargs.get('textColour', (0, 0, 0))
         self.fontSize = kwargs.get('fontSize', 20)
-        self.font = kwargs.get('font', pygame.font.SysFont('sans-serif', self.fontSize))
-        self.texts = [self.font.render(self.items[row], True, self.textColour) for row in range(self.rows)]
-        self.textRects = self.createTextRects()
+        self.font = kwargs.get('font') or FontRegistry.getFont('sans-serif', self.fontSize)
 
         self.clicked = False
 
+        # Row backgrounds, labels and empty circles, rebuilt when anything they depend on changes
+        self._surface = None
+        self._corners = []
+        self._origin = (self._x, self._y)  # Position the rows were laid out at
+        self.refresh()
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in self.CACHED_ATTRIBUTES:
+            super().__setattr__('_surface', None)
+
+    def setItems(self, items):
+        """Change the items. Assign a new sequence rather than editing the items in place, or call refresh after"""
+        self.items = items
+
+    def refresh(self):
+        """ Recreate the cached rows. Done automatically when the attributes in CACHED_ATTRIBUTES are assigned, call
+        it after editing the items in place
+        """
+        self._origin = (self._x, self._y)
+        self.rows = len(self.items)
+        visibleRows = self.countVisibleRows()
+        self.rowHeight = self._height // visibleRows
+        self._scroll = max(0, min(self._scroll, self.rows - visibleRows))
+
+        self.texts = [
+            TextCache.render(self.font, self.items[self._scroll + row], True, self.textColour)
+            for row in range(visibleRows)
+        ]
+        self.textRects = self.createTextRects()
         self.circles = self.createCircleLocations()
 
+        self._surface = createRowSurface(
+            self._width, self._height, self.radius, (self.colour1, self.colour2, self.textColour, self.circleColour)
+        )
+        drawRows(self._surface, visibleRows, self.rowHeight, self.colour1, self.colour2, self.radius, self._scroll)
+        for row in range(visibleRows):
+            x, y = self.circles[row]
+            pygame.draw.circle(
+                self._surface, self.circleColour, (x - self._x, y - self._y), self.circleRadius, self.circleThickness
+            )
+            self._surface.blit(self.texts[row], self.textRects[row].move(-self._x, -self._y))
+        self._corners = createCorners(self._surface, self.radius)
+        self.markDirty()
+
+    def updateCache(self):
+        """Recreate the cached rows if they have been cleared, and move the circles and labels with the list"""
+        if self._surface is None:
+            self.refresh()
+
+        dx, dy = self._x - self._origin[0], self._y - self._origin[1]
+        if dx or dy:
+            self._origin = (self._x, self._y)
+            self.textRects = [rect.move(dx, dy) for rect in self.textRects]
+            self.circles = [(x + dx, y + dy) for x, y in self.circles]
+
+    def countVisibleRows(self):
+        return self.rows if self.visibleRows is None else max(1, min(self.visibleRows, self.rows))
+
+    def getRowAt(self, x, y):
+        """ Index of the item in the row at a point, found from the row height rather than by testing every row
+
+        :param x: X-coordinate on win
+        :param y: Y-coordinate on win
+        :return: Index of the item, or None if the point is outside of the rows
+        :rtype: int or None
+        """
+        if not self._x <= x < self._x + self._width or y < self._y:
+            return None
+
+        row = (y - self._y) // self.rowHeight
+        if row >= self.countVisibleRows():
+            return None
+        return self._scroll + row
+
+    def getScroll(self):
+        return self._scroll
+
+    def setScroll(self, scroll):
+        """ Scroll the list so that the item at the given index is shown first. Only has an effect when visibleRows
+        is set and there are more items than that
+
+        :param scroll: Index of the first item shown
+        :type scroll: int
+        """
+        scroll = max(0, min(scroll, self.rows - self.countVisibleRows()))
+        if scroll != self._scroll:
+            self._scroll = scroll
+            self.markDirty()
+
+    def _scrollRows(self, events):
+        if self.visibleRows is not None:
+            for event in events:
+                if event.type == pygame.MOUSEWHEEL:
+                    self.setScroll(self._scroll - event.y)
+
     def createTextRects(self):
         textRects = []
-        for row in range(self.rows):
+        for row in range(len(self.texts)):
             textRects.append(
                 self.texts[row].get_rect(
                     center=(
@@ -209,7 +485,7 @@ class Radio(WidgetBase):
 
     def createCircleLocations(self):
         circles = []
-        for row in range(self.rows):
+        for row in range(self.countVisibleRows()):
             circles.append((
                 self._x + self.circleRadius * 3,
                 self._y + self.rowHeight * row + self.rowHeight // 2,
@@ -227,48 +503,27 @@ class Radio(WidgetBase):
             x, y = Mouse.getMousePos()
 
             if self.contains(x, y):
+                self._scrollRows(events)
                 if mouseState == MouseState.CLICK:
-                    for row in range(self.rows):
-                        if math.sqrt((self.circles[row][0] - x) ** 2 +
-                                     (self.circles[row][1] - y) ** 2) <= self.circleRadius:
+                    self.updateCache()
+                    offsetX, offsetY = self.win.get_abs_offset()
+                    x, y = x - offsetX, y - offsetY
+                    row = self.getRowAt(x, y)
+                    if row is not None:
+                        circleX, circleY = self.circles[row - self._scroll]
+                        if math.sqrt((circleX - x) ** 2 + (circleY - y) ** 2) <= self.circleRadius:
                             self.selected = row
+                            self.markDirty()
 
     def draw(self):
         """ Display to surface """
         if not self._hidden:
-            for row in range(self.rows):
-                colour = self.colour1 if not row % 2 else self.colour2
-                if pygame.version.vernum[0] < 2:
-                    pygame.draw.rect(
-                        self.win, colour, (self._x, self._y + self.rowHeight * row, self._width, self.rowHeight)
-                    )
-
-                else:
-                    if row == 0:
-                        pygame.draw.rect(
-                            self.win, colour, (self._x, self._y + self.rowHeight * row, self._width, self.rowHeight),
-                            border_top_left_radius=self.radius, border_top_right_radius=self.radius
-                        )
-
-                    elif row == self.rows - 1:
-                        pygame.draw.rect(
-                            self.win, colour, (self._x, self._y + self.rowHeight * row, self._width, self.rowHeight),
-                            border_bottom_left_radius=self.radius, border_bottom_right_radius=self.radius
-                        )
-
-                    else:
-                        pygame.draw.rect(
-                            self.win, colour, (self._x, self._y + self.rowHeight * row, self._width, self.rowHeight)
-                        )
-
-                width = 0 if row == self.selected else self.circleThickness
-                pygame.draw.circle(
-                    self.win, self.circleColour,
-                    self.circles[row], self.circleRadius,
-                    width
-                )
+            self.updateCache()
+            blitRows(self.win, self._surface, self._corners, self._x, self._y)
 
-                self.win.blit(self.texts[row], self.textRects[row])
+            row = self.selected - self._scroll
+            if 0 <= row < len(self.circles):
+                pygame.draw.circle(self.win, self.circleColour, self.circles[row], self.circleRadius)
 
 
 if __name__ == '__main__':
@@ -57,6 +57,7 @@ class Slider(WidgetBase):
                 self.selected = False
 
             if self.selected:
+                previousValue = self.value
                 if self.vertical:
                     self.value = self.max - self.round((y - self._y) / self._height * (self.max - self.min))
                     self.value = max(min(self.value, self.max), self.min)
@@ -64,6 +65,9 @@ class Slider(WidgetBase):
                     self.value = self.round((x - self._x) / self._width * (self.max - self.min) + self.min)
                     self.value = max(min(self.value, self.max), self.min)
 
+                if self.value != previousValue:
+                    self.markDirty()
+
     def draw(self):
         if not self._hidden:
             pygame.draw.rect(self.win, self.colour, (self._x, self._y, self._width, self._height))
@@ -112,6 +116,11 @@ class Slider(WidgetBase):
 
         return False
 
+    def getBoundingRect(self):
+        # The handle can extend past the track
+        return pygame.Rect(self._x, self._y, self._width, self._height).inflate(
+            self.handleRadius * 2, self.handleRadius * 2
+        )
 
     def round(self, value):
         return self.step * round(value / self.step)
@@ -121,6 +130,7 @@ class Slider(WidgetBase):
 
     def setValue(self, value):
         self.value = value
+        self.markDirty()
 
 
 if __name__ == '__main__':
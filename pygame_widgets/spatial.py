@@ -0,0 +1,86 @@
+import weakref
+
+
+class SpatialGrid:
+    def __init__(self, cellSize=128):
+        """ A uniform grid used to find the widgets under a point without checking every widget
+
+        :param cellSize: Width and height of each grid cell in pixels
+        :type cellSize: int
+        """
+        self.cellSize = cellSize
+
+        self._cells = {}  # {(column, row): {id(widget)}}
+        self._widgetCells = {}  # {id(widget): [(column, row)]}
+        self._refs = {}  # {id(widget): weakref.ref(widget)}
+
+    def __len__(self):
+        return len(self._refs)
+
+    def __contains__(self, widget):
+        return id(widget) in self._refs
+
+    def _cellRange(self, rect):
+        # One pixel of slack on each side covers float positions truncated by pygame.Rect
+        left = (rect.left - 1) // self.cellSize
+        right = (rect.right + 1) // self.cellSize
+        top = (rect.top - 1) // self.cellSize
+        bottom = (rect.bottom + 1) // self.cellSize
+
+        return [(column, row) for column in range(left, right + 1) for row in range(top, bottom + 1)]
+
+    def insert(self, widget, rect):
+        """ Add a widget, or move it if it is already in the grid
+
+        :param widget: The widget to add
+        :param rect: Bounding rectangle of the widget in screen coordinates
+        :type rect: pygame.Rect
+        """
+        key = id(widget)
+        cells = self._cellRange(rect)
+
+        if key in self._refs:
+            if self._widgetCells[key] == cells:
+                return
+            self._unlink(key)
+        else:
+            self._refs[key] = weakref.ref(widget, lambda _, key=key: self._forget(key))
+
+        self._widgetCells[key] = cells
+        for cell in cells:
+            self._cells.setdefault(cell, set()).add(key)
+
+    def remove(self, widget):
+        self._forget(id(widget))
+
+    def clear(self):
+        self._cells.clear()
+        self._widgetCells.clear()
+        self._refs.clear()
+
+    def query(self, x, y):
+        """ Get the widgets whose bounding rectangles may contain the point
+
+        :param x: X-coordinate in screen coordinates
+        :param y: Y-coordinate in screen coordinates
+        :return: Candidate widgets in no particular order
+        """
+        keys = self._cells.get((x // self.cellSize, y // self.cellSize), ())
+        widgets = []
+        for key in keys:
+            widget = self._refs[key]()
+            if widget is not None:
+                widgets.append(widget)
+
+        return widgets
+
+    def _unlink(self, key):
+        for cell in self._widgetCells.pop(key, ()):
+            keys = self._cells[cell]
+            keys.discard(key)
+            if not keys:
+                del self._cells[cell]
+
+    def _forget(self, key):
+        self._unlink(key)
+        self._refs.pop(key, None)
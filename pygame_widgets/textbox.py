@@ -1,8 +1,11 @@
+import bisect
+import itertools
 import pygame
 import pygame_widgets
 import time
 import pyperclip
 
+from pygame_widgets.font import FontRegistry, TextCache
 from pygame_widgets.widget import WidgetBase
 from typing import Literal
 from pygame_widgets.mouse import Mouse, MouseState
@@ -14,6 +17,8 @@ class TextBox(WidgetBase):
     REPEAT_INTERVAL = 70
     CURSOR_INTERVAL = 400
 
+    LINE_WIDTH_CACHE_SIZE = 1024
+
     def __init__(
         self,
         win: pygame.Surface,
@@ -57,6 +62,7 @@ class TextBox(WidgetBase):
         self.highlightEndLine = 0
         self.highlightStartInline = 0
         self.highlightEndInline = 0
+        self.multiClickPos = None  # Where a word or line was selected, dragging from here keeps the selection
 
         self.escape = False
 
@@ -78,7 +84,7 @@ class TextBox(WidgetBase):
         self.textColour = kwargs.get('textColour', (0, 0, 0))
         self.highlightColour = kwargs.get('highlightColour', (166, 210, 255))
         self.fontSize = kwargs.get('fontSize', 20)
-        self.font = kwargs.get('font', pygame.font.SysFont('calibri', self.fontSize))
+        self.font = kwargs.get('font') or FontRegistry.getFont('calibri', self.fontSize)
         self.tabSpaces = kwargs.get('tabSpaces', 4)
 
         self.textOffsetTop = self.fontSize // 3
@@ -111,6 +117,9 @@ class TextBox(WidgetBase):
         )
 
         self._charWidthCache = {}  # {char: width}
+        self._lineWidthCache = {}  # {(left, line): cumulative widths}
+        self._glyphCache = {}  # {(font, colour, char): surface}
+        self._lineCache = {}  # {(font, colour, line): surface}, only holds the lines drawn last frame
 
     def listen(self, events: list[pygame.event.Event]) -> None:
         """Wait for inputs
@@ -123,11 +132,13 @@ class TextBox(WidgetBase):
         if self.keyDown:
             self.updateRepeatKey()
 
+        wasSelected = self.selected
+
         # Selection
-        mouseState = Mouse.getMouseState()
+        mouseState = Mouse.getMouseState(multiClick=True)
         x, y = Mouse.getMousePos()
 
-        if mouseState == MouseState.CLICK:
+        if mouseState in (MouseState.CLICK, MouseState.DOUBLE_CLICK, MouseState.TRIPLE_CLICK):
             if self.contains(x, y):
                 self.selected = True
                 self.showCursor = True
@@ -136,13 +147,21 @@ class TextBox(WidgetBase):
 
                 self.highlightStartLine = self.selectedLine
                 self.highlightStartInline = self.cursorPosition
+
+                self.multiClickPos = None
+                if mouseState == MouseState.DOUBLE_CLICK:
+                    self.selectWord()
+                    self.multiClickPos = (x, y)
+                elif mouseState == MouseState.TRIPLE_CLICK:
+                    self.selectLine()
+                    self.multiClickPos = (x, y)
             else:
                 self.selected = False
                 self.showCursor = False
                 self.cursorTime = time.time()
                 self.resetHighlight()
 
-        elif mouseState == MouseState.DRAG and self.contains(x, y):
+        elif mouseState == MouseState.DRAG and self.contains(x, y) and (x, y) != self.multiClickPos:
             self.selected = True
             self.showCursor = True
             self.cursorTime = time.time()
@@ -168,15 +187,7 @@ class TextBox(WidgetBase):
 
                     elif event.key == pygame.K_RETURN and not self.isLabel:
                         if event.mod & pygame.KMOD_SHIFT:
-                            if not self.isEmptyText(self.highlightedText):
-                                self.eraseHighlightedText()
-                                self.shiftLines()
-                            newlineText = self.text[self.selectedLine][
-                                self.cursorPosition:
-                            ]
-                            del self.text[self.selectedLine][self.cursorPosition:]
-                            self.addText('\n' + ''.join(newlineText))
-                            self.cursorPosition = 0
+                            self.addText('\n')
                         else:
                             self.onSubmit(*self.onSubmitParams)
 
@@ -281,6 +292,13 @@ class TextBox(WidgetBase):
                 elif event.type == pygame.MOUSEWHEEL:
                     self.scroll(event.y)
 
+        if self.selected != wasSelected:
+            self.markDirty()
+
+    def isDirty(self) -> bool:
+        # The cursor blinks and the highlight follows the mouse while selected
+        return self._dirty or self.selected
+
     def draw(self) -> None:
         """Display to surface"""
         if not self._hidden:
@@ -463,25 +481,79 @@ class TextBox(WidgetBase):
             text = [list(self.placeholderText)]
             colour = self.placeholderTextColour
 
+        # Lines are only re-rendered when their contents change
+        lineCache = {}
         for lineIndex, line in enumerate(text):
-            x = [self._x + self.textOffsetLeft]
-            for char in line:
-                if self.isSpecialChar(char):
-                    continue
-                charRender = self.font.render(
-                    char,
-                    True,
-                    colour,
-                )
-                textRect = charRender.get_rect(
-                    bottomleft=(
-                        x[-1],
-                        self._y + self.fontSize * (lineIndex + 1) + self.textOffsetTop,
+            key = (self.font, self.getColourKey(colour), ''.join(line))
+            if key not in lineCache:
+                lineCache[key] = self._lineCache[key] if key in self._lineCache else self.renderLine(line, colour)
+
+            lineRender = lineCache[key]
+
+            if lineRender is not None:
+                self.win.blit(
+                    lineRender,
+                    lineRender.get_rect(
+                        bottomleft=(
+                            self._x + self.textOffsetLeft,
+                            self._y + self.fontSize * (lineIndex + 1) + self.textOffsetTop,
+                        )
                     )
                 )
 
-                self.win.blit(charRender, textRect)
-                x.append(x[-1] + charRender.get_width())
+        self._lineCache = lineCache
+
+    def renderLine(self, line: list[str], colour) -> pygame.Surface | None:
+        """
+        Render a line of text by placing each character after the last, so that it matches getLineWidth
+
+        Args:
+            line (list[str]): The characters of the line
+            colour: The colour of the text
+
+        Returns:
+            pygame.Surface | None: The rendered line, or None if there is nothing to draw
+        """
+        glyphs = [self.getGlyph(char, colour) for char in line if not self.isSpecialChar(char)]
+        if not glyphs:
+            return None
+
+        height = max(glyph.get_height() for glyph in glyphs)
+        lineRender = pygame.Surface((sum(glyph.get_width() for glyph in glyphs), height), pygame.SRCALPHA)
+
+        x = 0
+        for glyph in glyphs:
+            # Copy the glyph's pixels rather than blending them onto the transparent surface
+            lineRender.blit(glyph, (x, height - glyph.get_height()), special_flags=pygame.BLEND_RGBA_MAX)
+            x += glyph.get_width()
+
+        return lineRender
+
+    def getGlyph(self, char: str, colour=None) -> pygame.Surface:
+        """
+        Get a rendered character, which is only rendered the first time it is used with the font and colour
+
+        Args:
+            char (str): The character to render
+            colour: The colour of the character, defaults to textColour
+
+        Returns:
+            pygame.Surface: The rendered character
+        """
+        if colour is None:
+            colour = self.textColour
+
+        key = (self.font, self.getColourKey(colour), char)
+        glyph = self._glyphCache.get(key)
+        if glyph is None:
+            glyph = self._glyphCache[key] = TextCache.render(self.font, char, True, colour)
+
+        return glyph
+
+    @staticmethod
+    def getColourKey(colour) -> tuple | str:
+        # pygame.Color and lists cannot be used as dictionary keys
+        return colour if isinstance(colour, (tuple, str)) else tuple(colour)
 
     def drawCursor(self) -> None:
         if (
@@ -523,8 +595,7 @@ class TextBox(WidgetBase):
                 if self.isSpecialChar(char):
                     char = ' '
                     shift += 1
-                charRender = self.font.render(char, True, self.highlightColour)
-                rect = charRender.get_rect(
+                rect = self.getGlyph(char).get_rect(
                     bottomleft=(
                         lineWidth[charIndex - shift],
                         self._y
@@ -660,6 +731,74 @@ class TextBox(WidgetBase):
         self.selectedLine = min(startLine, len(self.text) - 1)
         self.cursorPosition = startInline
         self.resetHighlight()
+        self.markDirty()
+
+    @staticmethod
+    def isWordChar(char: str) -> bool:
+        return char.isalnum() or char in '_-'
+
+    def selectWord(self) -> None:
+        """Highlight the word around the cursor, including any part of it wrapped onto other lines"""
+        startLine, start = self.selectedLine, self.cursorPosition
+        while True:
+            if start > 0 and self.isWordChar(self.text[startLine][start - 1]):
+                start -= 1
+            elif (
+                start == 0 and startLine > 0
+                and self.text[startLine - 1] and self.isWordChar(self.text[startLine - 1][-1])
+            ):
+                # Lines ending in a word character were wrapped, so the word continues on the previous line
+                startLine -= 1
+                start = len(self.text[startLine])
+            else:
+                break
+
+        endLine, end = self.selectedLine, self.cursorPosition
+        while True:
+            if end < len(self.text[endLine]) and self.isWordChar(self.text[endLine][end]):
+                end += 1
+            elif (
+                end == len(self.text[endLine]) and endLine + 1 < len(self.text)
+                and self.text[endLine + 1] and self.isWordChar(self.text[endLine + 1][0])
+                and end and self.isWordChar(self.text[endLine][-1])
+            ):
+                endLine += 1
+                end = 0
+            else:
+                break
+
+        self.setHighlight(startLine, start, endLine, end)
+
+    def selectLine(self) -> None:
+        """Highlight the whole line under the cursor, up to the previous and next newlines"""
+        startLine = self.selectedLine
+        while startLine > 0 and self.text[startLine - 1] and self.text[startLine - 1][-1] != '\n':
+            startLine -= 1
+
+        endLine = self.selectedLine
+        while endLine + 1 < len(self.text) and self.text[endLine] and self.text[endLine][-1] != '\n':
+            endLine += 1
+
+        end = len(self.text[endLine])
+        if end and self.text[endLine][-1] == '\n':
+            end -= 1
+
+        self.setHighlight(startLine, 0, endLine, end)
+
+    def setHighlight(self, startLine: int, startInline: int, endLine: int, endInline: int) -> None:
+        """
+        Highlights text and moves the cursor to the end of it
+
+        Args:
+            startLine (int): The line the highlight starts on
+            startInline (int): The position in the start line the highlight starts at
+            endLine (int): The line the highlight ends on
+            endInline (int): The position in the end line the highlight ends at
+        """
+        self.highlightStartLine, self.highlightStartInline = startLine, startInline
+        self.highlightEndLine, self.highlightEndInline = endLine, endInline
+        self.selectedLine, self.cursorPosition = endLine, endInline
+        self.markDirty()
 
     def resetHighlight(self) -> None:
         self.highlightStartLine = self.highlightEndLine = 0
@@ -667,27 +806,20 @@ class TextBox(WidgetBase):
         self.highlightedText = [[]]
 
     def updateCursorPosition(self, x: float, y: float) -> None:
-        lineY = self._y + self.borderThickness + self.textOffsetTop
-        for lineIndex in range(len(self.text)):
-            if lineY <= y < lineY + self.fontSize:
-                self.selectedLine = lineIndex + self.firstVisibleLine
-                break
-            lineY += self.fontSize
+        lineIndex = int((y - self._y - self.borderThickness - self.textOffsetTop) // self.fontSize)
+        if 0 <= lineIndex < len(self.text):
+            self.selectedLine = lineIndex + self.firstVisibleLine
 
         self.selectedLine = min(self.selectedLine, len(self.text) - 1)
         self.selectedLine = max(self.selectedLine, self.firstVisibleLine)
 
         lineWidth = self.getLineWidth(self.selectedLine)
-        countSpecChars = self.getCountSpecChars(self.selectedLine)
-        textLength = len(self.text[self.selectedLine]) - countSpecChars
+        textLength = len(lineWidth) - 1
 
-        for charIndex in range(textLength):
-            midX = (lineWidth[charIndex] + lineWidth[charIndex + 1]) / 2
-            if midX >= x:
-                self.cursorPosition = charIndex
-                break
-        else:
-            self.cursorPosition = textLength
+        # The cursor goes before the first character whose midpoint is at or after x
+        self.cursorPosition = bisect.bisect_left(
+            range(textLength), x, key=lambda charIndex: (lineWidth[charIndex] + lineWidth[charIndex + 1]) / 2
+        )
 
         if x <= lineWidth[0] / 2:
             self.cursorPosition = 0
@@ -697,56 +829,57 @@ class TextBox(WidgetBase):
         Add text to the text box
 
         This method will insert the given text into the text box at the current cursor position.
-        The text will be split into individual characters and inserted one by one.
+        The text is inserted in one go and only the lines it affects are re-wrapped.
         If a line is too long, the characters will be split onto the next line.
-        If the cursor is at the end of the text box, a new line will be added.
+        Newlines start a new line, carrying the text after the cursor with them.
 
         Args:
             text (str): The text to add to the text box
         """
-        text = list(str(text).replace('\t', ' ' * self.tabSpaces))
-
-        for char in text:
-            if not char or self.isSpecialChar(char) and char != '\n':
-                continue
+        chars = [
+            char for char in str(text).replace('\t', ' ' * self.tabSpaces)
+            if not self.isSpecialChar(char) or char == '\n'
+        ]
 
+        if chars:
             if not self.isEmptyText(self.highlightedText):
                 self.eraseHighlightedText()
                 self.shiftLines()
 
-            if char == '\n':
-                self.text[self.selectedLine].append('\n')
-                self.text.insert(self.selectedLine + 1, [])
-                self.selectedLine += 1
+            if self.selectedLine >= len(self.text):
+                self.text.append([])
+                self.selectedLine = len(self.text) - 1
                 self.cursorPosition = 0
-            else:
-                try:
-                    self.text[self.selectedLine].insert(self.cursorPosition, char)
-                except IndexError:
-                    self.text.append([char])
 
-            for lineIndex in range(self.selectedLine, len(self.text)):
-                lineWidth = self.getLineWidth(lineIndex)
+            line = self.text[self.selectedLine]
 
-                for charIndex in range(
-                    len(self.text[lineIndex]) - self.getCountSpecChars(lineIndex)
-                ):
-                    if lineWidth[charIndex] >= self._x + self._actual_width:
-                        try:
-                            self.text[lineIndex + 1].insert(
-                                0, self.text[lineIndex].pop()
-                            )
-                        except IndexError:
-                            self.text.insert(
-                                lineIndex + 1, [self.text[lineIndex].pop()]
-                            )
-
-                        if self.cursorPosition >= len(self.text[lineIndex]):
-                            self.selectedLine += 1
-                            self.cursorPosition = 0
+            # Never insert after a line's newline
+            position = min(self.cursorPosition, len(line) - (1 if line and line[-1] == '\n' else 0))
+            tail = line[position:]
 
-            self.cursorPosition += 1
+            # Split the inserted text into lines, each ending with a newline except the last
+            newLines = [line[:position]]
+            for char in chars:
+                newLines[-1].append(char)
+                if char == '\n':
+                    newLines.append([])
 
+            cursorLine = self.selectedLine + len(newLines) - 1
+            cursorPosition = len(newLines[-1])
+            newLines[-1].extend(tail)
+            self.text[self.selectedLine:self.selectedLine + 1] = newLines
+
+            # Wrap from the bottom up so that lines above the cursor only shift it down
+            cursorLine, cursorPosition = self.wrapText(cursorLine, cursorPosition)
+            for lineIndex in range(self.selectedLine + len(newLines) - 2, self.selectedLine - 1, -1):
+                numLines = len(self.text)
+                self.wrapText(lineIndex)
+                cursorLine += len(self.text) - numLines
+
+            self.selectedLine = cursorLine
+            self.cursorPosition = cursorPosition
+
+        self.markDirty()
         self.onTextChanged(*self.onTextChangedParams)
         self.firstVisibleLine = max(
             self.firstVisibleLine, len(self.text) - self.maxVisibleLines
@@ -754,10 +887,84 @@ class TextBox(WidgetBase):
         while self.selectedLine < self.firstVisibleLine:
             self.firstVisibleLine -= 1
 
+    def wrapLine(self, line: list[str]) -> list[list[str]]:
+        """
+        Split a line into lines that fit in the text box
+
+        A character fits on a line if it starts before the right edge of the text box.
+
+        Args:
+            line (list[str]): The characters of the line
+
+        Returns:
+            list[list[str]]: The lines, of which only the last can be empty
+        """
+        left = self._x + self.textOffsetLeft
+        right = self._x + self._actual_width
+
+        lines = []
+        start = 0
+        x = left
+        for charIndex, char in enumerate(line):
+            if self.isSpecialChar(char):
+                continue
+
+            if x >= right and charIndex > start:
+                lines.append(line[start:charIndex])
+                start = charIndex
+                x = left
+
+            x += self.getCharWidth(char)
+
+        lines.append(line[start:])
+        return lines
+
+    def wrapText(self, lineIndex: int, position: int = 0) -> tuple[int, int]:
+        """
+        Re-wrap the text from a line that may have become too long
+
+        Characters that do not fit are moved to the start of the next line if the line has no newline,
+        otherwise onto new lines. Wrapping stops at the first line that fits, as the lines after it are unaffected.
+
+        Args:
+            lineIndex (int): The line that may be too long
+            position (int): A position in that line to follow, such as the cursor
+
+        Returns:
+            tuple[int, int]: The line and position that the followed position was moved to
+        """
+        followedLine = lineIndex
+        following = True
+
+        while lineIndex < len(self.text):
+            line = self.text[lineIndex]
+            lines = self.wrapLine(line)
+            if len(lines) == 1:
+                break
+
+            if following:
+                for offset, wrappedLine in enumerate(lines):
+                    if position <= len(wrappedLine) or offset == len(lines) - 1:
+                        break
+                    position -= len(wrappedLine)
+
+                followedLine = lineIndex + offset
+                following = offset == len(lines) - 1
+
+            if line[-1] != '\n' and lineIndex + 1 < len(self.text):
+                # The overflow continues onto the next line, which may then become too long itself
+                lines[-1].extend(self.text[lineIndex + 1])
+                self.text[lineIndex:lineIndex + 2] = lines
+            else:
+                self.text[lineIndex:lineIndex + 1] = lines
+
+            lineIndex += len(lines) - 1
+
+        return followedLine, position
+
     def getCharWidth(self, char: str) -> int:
         if char not in self._charWidthCache:
-            charRender = self.font.render(char, True, self.textColour)
-            self._charWidthCache[char] = charRender.get_width()
+            self._charWidthCache[char] = self.getGlyph(char).get_width()
         return self._charWidthCache[char]
 
     def getLineWidth(self, line: int) -> list[float]:
@@ -773,13 +980,20 @@ class TextBox(WidgetBase):
         Returns:
             list[float]: A list of the x-coordinates of the end of each character in the line
         """
-        x = [self._x + self.textOffsetLeft]
-        for char in self.text[line]:
-            if self.isSpecialChar(char):
-                continue
-            charRender = self.getCharWidth(char)
-            x.append(x[-1] + charRender)
-        return x
+        left = self._x + self.textOffsetLeft
+        key = (left, ''.join(self.text[line]))
+
+        lineWidth = self._lineWidthCache.get(key)
+        if lineWidth is None:
+            if len(self._lineWidthCache) >= self.LINE_WIDTH_CACHE_SIZE:
+                self._lineWidthCache.clear()
+
+            lineWidth = self._lineWidthCache[key] = list(itertools.accumulate(
+                (self.getCharWidth(char) for char in self.text[line] if not self.isSpecialChar(char)),
+                initial=left
+            ))
+
+        return lineWidth
 
     def shiftLines(self) -> None:
         shift = 0
@@ -787,23 +1001,28 @@ class TextBox(WidgetBase):
         for lineIndex in range(self.selectedLine, len(self.text) - 1):
             current_line = lineIndex - shift
             if not self.text[current_line] or self.text[current_line][-1] == '\n':
-                continue
-
-            while True:
-                lineWidth = self.getLineWidth(current_line)
-                if lineWidth[-1] >= self._x + self._actual_width:
-                    break
-
-                if not self.text[current_line + 1]:
+                if lineIndex > self.selectedLine:
                     break
+                continue
 
-                self.text[current_line].append(self.text[current_line + 1].pop(0))
+            # Only the edited lines and those they pull from can have room, the rest are already full
+            pulled = False
+            lineEnd = self.getLineWidth(current_line)[-1]
+            while lineEnd < self._x + self._actual_width and self.text[current_line + 1]:
+                char = self.text[current_line + 1].pop(0)
+                self.text[current_line].append(char)
+                if not self.isSpecialChar(char):
+                    lineEnd += self.getCharWidth(char)
+                pulled = True
 
                 if not self.text[current_line + 1]:
                     self.text.pop(current_line + 1)
                     shift += 1
                     break
 
+            if not pulled and lineIndex > self.selectedLine:
+                break
+
     def getCountSpecChars(self, line: int) -> int:
         return len([char for char in self.text[line] if self.isSpecialChar(char)])
 
@@ -820,6 +1039,7 @@ class TextBox(WidgetBase):
         self.selectedLine = 0
         self.firstVisibleLine = 0
         self.cursorPosition = 0
+        self.markDirty()
         self.addText(text)
 
     def setCursorPosition(self, position: int) -> None:
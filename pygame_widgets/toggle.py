@@ -28,6 +28,7 @@ class Toggle(WidgetBase):
         self.value = not self.value
         self.colour = self.onColour if self.value else self.offColour
         self.handleColour = self.handleOnColour if self.value else self.handleOffColour
+        self.markDirty()
 
     def listen(self, events):
         if not self._hidden and not self._disabled:
@@ -56,6 +57,11 @@ class Toggle(WidgetBase):
             gfxdraw.filled_circle(self.win, *circle, self.handleRadius, self.handleColour)
             gfxdraw.aacircle(self.win, *circle, self.handleRadius, self.handleColour)
 
+    def getBoundingRect(self):
+        # The ends and handle are drawn outside of the widget's rectangle
+        extent = max(self.radius, self.handleRadius) * 2
+        return super().getBoundingRect().inflate(extent, extent)
+
     def getValue(self) -> bool:
         return self.value
 
@@ -5,9 +5,11 @@ from collections import OrderedDict
 
 from abc import abstractmethod, ABC
 
+import pygame
 from pygame.event import Event
 
 from pygame_widgets.mouse import Mouse
+from pygame_widgets.spatial import SpatialGrid
 
 
 # Implementation of an insertion-ordered set. Necessary to keep track of the order in which widgets are added.
@@ -57,6 +59,164 @@ class OrderedWeakset(weakref.WeakSet):
         self.data.move_to_start(weakref.ref(item, self._remove))
 
 
+class ZOrder:
+    def __init__(self, values=()):
+        """ The widgets of the WidgetHandler from bottom to top, without keeping them alive
+
+        Each widget has one weak reference for as long as it is held, so moving a widget is constant time and
+        allocates nothing. Widgets moved to the top are kept in one dictionary and widgets moved to the bottom in
+        another, both in the order they were moved, and the references are only copied out again when the order
+        is next iterated after a change
+
+        :param values: Widgets to add, bottom first
+        """
+        self._raised = {}  # {id(widget): weakref.ref(widget)}, beneath the widgets added after them
+        self._lowered = {}  # {id(widget): weakref.ref(widget)}, above the widgets added after them
+        self._order = ()  # References from bottom to top
+        self._changed = False
+        self._top = 0
+        self._bottom = 0
+
+        for widget in values:
+            self.add(widget)
+
+    def __len__(self):
+        return len(self._raised) + len(self._lowered)
+
+    def __contains__(self, widget):
+        return self._get(widget) is not None
+
+    def __iter__(self):
+        return iter(self.snapshot())
+
+    def add(self, widget):
+        if widget not in self:
+            key = id(widget)
+            self._raised[key] = weakref.ref(widget, lambda ref, key=key: self._forget(key, ref))
+            self._top += 1
+            widget._zIndex = self._top
+            self._changed = True
+
+    def remove(self, widget):
+        if widget not in self:
+            raise KeyError(widget)
+
+        self._pop(id(widget))
+        self._changed = True
+
+    def discard(self, widget):
+        if widget in self:
+            self.remove(widget)
+
+    def _get(self, widget):
+        # The reference to a widget, or None if it is not held
+        key = id(widget)
+        ref = self._raised.get(key) or self._lowered.get(key)
+        return ref if ref is not None and ref() is widget else None
+
+    def _pop(self, key):
+        ref = self._raised.pop(key, None)
+        return ref if ref is not None else self._lowered.pop(key)
+
+    def _forget(self, key, ref):
+        if self._raised.get(key) is ref or self._lowered.get(key) is ref:
+            self._pop(key)
+            self._changed = True
+
+    def moveToTop(self, widget):
+        """ Move a widget above all others
+
+        :return: Whether the order changed
+        :rtype: bool
+        """
+        key = id(widget)
+        if widget._zIndex == self._top and key in self._raised:
+            return False
+
+        # Raises a KeyError if the widget is not held
+        self._raised[key] = self._lowered.pop(key, None) or self._raised.pop(key)
+        self._top += 1
+        widget._zIndex = self._top
+        self._changed = True
+        return True
+
+    def moveToBottom(self, widget):
+        """ Move a widget beneath all others
+
+        :return: Whether the order changed
+        :rtype: bool
+        """
+        key = id(widget)
+        if widget._zIndex == self._bottom and key in self._lowered:
+            return False
+
+        # Raises a KeyError if the widget is not held
+        self._lowered[key] = self._raised.pop(key, None) or self._lowered.pop(key)
+        self._bottom -= 1
+        widget._zIndex = self._bottom
+        self._changed = True
+        return True
+
+    def moveAllToTop(self, widgets):
+        """ Move widgets above all others, keeping their order. Widgets that are not held are ignored
+
+        :return: The widgets that were moved
+        :rtype: list of WidgetBase
+        """
+        raised, lowered, top = self._raised, self._lowered, self._top
+        moved = []
+        for widget in widgets:
+            key = id(widget)
+            ref = raised.pop(key, None) or lowered.pop(key, None)
+            if ref is not None:
+                raised[key] = ref
+                top += 1
+                widget._zIndex = top
+                moved.append(widget)
+
+        if moved:
+            self._top = top
+            self._changed = True
+        return moved
+
+    def moveAllToBottom(self, widgets):
+        """ Move widgets beneath all others, keeping their order. Widgets that are not held are ignored
+
+        :return: The widgets that were moved
+        :rtype: list of WidgetBase
+        """
+        raised, lowered, bottom = self._raised, self._lowered, self._bottom
+        moved = []
+        for widget in reversed(list(widgets)):
+            key = id(widget)
+            ref = lowered.pop(key, None) or raised.pop(key, None)
+            if ref is not None:
+                lowered[key] = ref
+                bottom -= 1
+                widget._zIndex = bottom
+                moved.append(widget)
+
+        if moved:
+            self._bottom = bottom
+            self._changed = True
+        return moved[::-1]
+
+    def snapshot(self):
+        """ The widgets from bottom to top. Widgets added, removed or moved afterwards do not affect the list
+
+        :return: The widgets
+        :rtype: list of WidgetBase
+        """
+        if self._changed:
+            self._order = (*reversed(self._lowered.values()), *self._raised.values())
+            self._changed = False
+
+        widgets = [ref() for ref in self._order]
+        if None in widgets:
+            # A widget was collected while its reference was being copied, before it was forgotten
+            widgets = [widget for widget in widgets if widget is not None]
+        return widgets
+
 
 class WidgetBase(ABC):
     def __init__(self, win, x, y, width, height, isSubWidget=False):
@@ -83,6 +243,26 @@ class WidgetBase(ABC):
         self._hidden = False
         self._disabled = False
 
+        # Position in the z-order, higher is drawn on top. Maintained by WidgetHandler
+        self._zIndex = 0
+
+        # Whether the widget needs to be redrawn when dirty rendering is enabled
+        self._dirty = True
+
+        # Tree of widgets moving together. The position of a child relative to its parent is kept so that its
+        # absolute position, _x and _y, can be recomputed after the parent has moved
+        self._parent = None
+        self._children = []
+        self._wasSubWidget = isSubWidget  # Whether the widget was a sub widget before it was made a child
+        # Versions are compared so that the positions of the children of a moved widget, and the bounds of the trees
+        # above it, are recomputed the next time they are needed rather than straight away
+        self._offsetX = 0
+        self._offsetY = 0
+        self._version = 0  # Incremented whenever the widget is moved or resized, or follows a moved ancestor
+        self._parentVersion = 0  # Version of the parent when the position was last recomputed
+        self._subtreeVersion = 0  # Incremented whenever a descendant is moved or resized
+        self._subtreeRect = None  # ((version, subtree version), bounding rect of the widget and its descendants)
+
         if not isSubWidget:
             WidgetHandler.addWidget(self)
 
@@ -98,19 +278,178 @@ class WidgetBase(ABC):
         return f'{type(self).__name__}(x = {self._x}, y = {self._y}, width = {self._width}, height = {self._height})'
 
     def contains(self, x, y):
-        return (self._x < x - self.win.get_abs_offset()[0] < self._x + self._width) and \
-               (self._y < y - self.win.get_abs_offset()[1] < self._y + self._height)
+        offsetX, offsetY = self.win.get_abs_offset()
+        return (self._x < x - offsetX < self._x + self._width) and \
+               (self._y < y - offsetY < self._y + self._height)
+
+    def getBoundingRect(self):
+        """ Screen-space rectangle enclosing everything the widget draws and every point for which contains can be
+        True. Override if the widget reaches outside of its own rectangle
+
+        :return: The bounding rectangle
+        :rtype: pygame.Rect
+        """
+        offsetX, offsetY = self.win.get_abs_offset()
+        return pygame.Rect(self._x + offsetX, self._y + offsetY, self._width, self._height)
 
     def hide(self):
         self._hidden = True
+        self._dirty = True
         if not self._isSubWidget:
             WidgetHandler.moveToBottom(self)
 
     def show(self):
         self._hidden = False
+        self._dirty = True
         if not self._isSubWidget:
             WidgetHandler.moveToTop(self)
 
+    def addChild(self, child):
+        """ Make a widget a child of this one, so that it keeps its position relative to this one when this one is
+        moved. The child is no longer handled by the WidgetHandler, so this widget must listen to and draw it
+
+        :param child: The widget, positioned where it currently is
+        :type child: WidgetBase
+        """
+        if child._parent is not None:
+            child._parent.removeChild(child)
+
+        child._wasSubWidget = child._isSubWidget
+        if not child._isSubWidget:
+            child.setIsSubWidget(True)
+
+        self.updateTransform()
+        child.updateTransform()
+        originX, originY = self.getChildOrigin()
+        child._parent = self
+        child._offsetX = child._x - originX
+        child._offsetY = child._y - originY
+        self._children.append(child)
+        WidgetHandler.updateWidget(child)
+
+    def removeChild(self, child):
+        """ Detach a child, which is handled by the WidgetHandler again unless it was a sub widget before it was
+        added
+
+        :param child: The widget
+        :type child: WidgetBase
+        """
+        self._children.remove(child)
+        child.updateTransform()
+        child._parent = None
+        WidgetHandler.updateWidget(self)
+
+        if not child._wasSubWidget:
+            child.setIsSubWidget(False)
+
+    def getParent(self):
+        return self._parent
+
+    def getChildren(self):
+        return self._children
+
+    def setWin(self, win):
+        """Set the surface the widget and its children are drawn on"""
+        self.win = win
+        for child in self._children:
+            child.setWin(win)
+        self.markDirty()
+
+    def getChildOrigin(self):
+        """Point on win that the offsets of the children are relative to"""
+        self.updateTransform()
+        return self._x, self._y
+
+    def getOffset(self):
+        """Position relative to the parent, or the absolute position if the widget has no parent"""
+        if self._parent is None:
+            return self._x, self._y
+        return self._offsetX, self._offsetY
+
+    def updateTransform(self):
+        """Recompute the absolute position of a child if a widget above it has moved since it was last computed"""
+        parent = self._parent
+        if parent is not None:
+            parent.updateTransform()
+            if self._parentVersion != parent._version:
+                originX, originY = parent.getChildOrigin()
+                self._x = originX + self._offsetX
+                self._y = originY + self._offsetY
+                self._parentVersion = parent._version
+                self._version += 1
+
+    def updateOffset(self):
+        """ Keep the position of a moved child relative to its parent, and invalidate the positions of its descendants
+        and the bounds of its ancestors
+        """
+        parent = self._parent
+        if parent is not None:
+            originX, originY = parent.getChildOrigin()
+            self._offsetX = self._x - originX
+            self._offsetY = self._y - originY
+            self._parentVersion = parent._version
+
+        self._version += 1
+        while parent is not None:
+            parent._subtreeVersion += 1
+            parent = parent._parent
+
+    def getRoot(self):
+        widget = self
+        while widget._parent is not None:
+            widget = widget._parent
+        return widget
+
+    def getSubtreeRect(self):
+        """ Screen-space rectangle enclosing the widget and all of its descendants, cached until the widget, one of its
+        ancestors or one of its descendants is moved or resized
+
+        :return: The bounding rectangle
+        :rtype: pygame.Rect
+        """
+        self.updateTransform()
+        if not self._children:
+            return self.getBoundingRect()
+
+        key = (self._version, self._subtreeVersion)
+        if self._subtreeRect is None or self._subtreeRect[0] != key:
+            rect = self.getBoundingRect().unionall([child.getSubtreeRect() for child in self._children])
+            self._subtreeRect = (key, rect)
+
+        return self._subtreeRect[1]
+
+    def getWidgetAt(self, x, y):
+        """ The topmost visible widget in this tree containing a point. Subtrees whose bounds do not contain the point
+        are skipped without testing their widgets
+
+        :param x: X-coordinate on the screen
+        :param y: Y-coordinate on the screen
+        :return: The widget, or None
+        :rtype: WidgetBase or None
+        """
+        if self._hidden or not self.getSubtreeRect().collidepoint(x, y):
+            return None
+
+        for child in reversed(self._children):
+            widget = child.getWidgetAt(x, y)
+            if widget is not None:
+                return widget
+
+        self.updateTransform()
+        return self if self.contains(x, y) else None
+
+    def markDirty(self):
+        """Flag that the widget looks different and must be redrawn when dirty rendering is enabled"""
+        self._dirty = True
+
+    def markClean(self):
+        self._dirty = False
+        for child in self._children:
+            child.markClean()
+
+    def isDirty(self):
+        return self._dirty or any(child.isDirty() for child in self._children)
+
     def disable(self):
         self._disabled = True
 
@@ -127,10 +466,14 @@ class WidgetBase(ABC):
         WidgetHandler.moveToBottom(self)
 
     def moveX(self, x):
+        self.updateTransform()
         self._x += x
+        WidgetHandler.updateWidget(self)
 
     def moveY(self, y):
+        self.updateTransform()
         self._y += y
+        WidgetHandler.updateWidget(self)
 
     def get(self, attr):
         """Default setter for any attributes. Call super if overriding
@@ -138,6 +481,9 @@ class WidgetBase(ABC):
         :param attr: Attribute to get
         :return: Value of the attribute
         """
+        if attr in ('x', 'y'):
+            self.updateTransform()
+
         if attr == 'x':
             return self._x
 
@@ -151,9 +497,11 @@ class WidgetBase(ABC):
             return self._height
 
     def getX(self):
+        self.updateTransform()
         return self._x
 
     def getY(self):
+        self.updateTransform()
         return self._y
 
     def getWidth(self):
@@ -174,6 +522,8 @@ class WidgetBase(ABC):
         :param attr: Attribute to set
         :param value: Value to set
         """
+        self.updateTransform()
+
         if attr == 'x':
             self._x = value
 
@@ -186,17 +536,28 @@ class WidgetBase(ABC):
         if attr == 'height':
             self._height = value
 
+        if attr in ('x', 'y', 'width', 'height'):
+            WidgetHandler.updateWidget(self)
+
     def setX(self, x):
+        self.updateTransform()
         self._x = x
+        WidgetHandler.updateWidget(self)
 
     def setY(self, y):
+        self.updateTransform()
         self._y = y
+        WidgetHandler.updateWidget(self)
 
     def setWidth(self, width):
+        self.updateTransform()
         self._width = width
+        WidgetHandler.updateWidget(self)
 
     def setHeight(self, height):
+        self.updateTransform()
         self._height = height
+        WidgetHandler.updateWidget(self)
 
     def setIsSubWidget(self, isSubWidget):
         self._isSubWidget = isSubWidget
@@ -207,53 +568,327 @@ class WidgetBase(ABC):
 
 
 class WidgetHandler:
-    _widgets: OrderedWeakset[weakref.ref] = OrderedWeakset()
+    _widgets: ZOrder = ZOrder()
+
+    # Optional SpatialGrid used to find the widgets under the mouse
+    _spatialIndex: SpatialGrid | None = None
+    _staleWidgets: weakref.WeakSet = weakref.WeakSet()  # Widgets whose bounds must be re-indexed
+
+    # Dirty rendering: background restored behind redrawn widgets, None when disabled
+    _background: pygame.Surface | tuple | None = None
+    _drawnRects: dict[int, tuple[weakref.ref, pygame.Rect]] = {}  # {id(widget): (ref, rect last drawn)}
+    _invalidRects: list[pygame.Rect] = []
+
+    # Optional Profiler timing each widget, None when disabled
+    _profiler = None
+    _latencyTracker = None
 
     @staticmethod
-    def main(events: list[Event]) -> None:
+    def main(events: list[Event]) -> list[pygame.Rect] | None:
+        mouseX, mouseY = Mouse.getMousePos()
+        profiler = WidgetHandler._profiler
+
+        # A snapshot is used to prevent errors when widgets are added/removed during iteration a.k.a safe iteration
+        widgets = WidgetHandler._widgets.snapshot()
+
+        if WidgetHandler._latencyTracker is not None:
+            WidgetHandler._latencyTracker.startFrame()
+
+        nearby = stale = None
+        if WidgetHandler._spatialIndex is not None:
+            # Only widgets near the mouse, or moved while listening this frame, can contain it
+            WidgetHandler._refreshSpatialIndex()
+            nearby = set(WidgetHandler._spatialIndex.query(mouseX, mouseY))
+            stale = WidgetHandler._staleWidgets
+            if profiler is not None:
+                profiler.countContains(len(nearby))
+
+        elif profiler is not None:
+            profiler.countContains(len(widgets))
+
         blocked = False
+        for widget in reversed(widgets):
+            if not blocked:
+                widget.listen(events) if profiler is None else profiler.listen(widget, events)
+
+                # Ensure widgets covered by others are not affected (widgets created later)
+                if (nearby is None or widget in nearby or widget in stale) \
+                        and widget.contains(mouseX, mouseY):  # TODO: Unless 'transparent'
+                    blocked = True
+
+            elif nearby is not None and widget not in nearby and widget not in stale \
+                    or not widget.contains(mouseX, mouseY):
+                widget.listen(events) if profiler is None else profiler.listen(widget, events)
+
+        rects = None
+        if WidgetHandler._background is not None:
+            rects = WidgetHandler._drawDirty(widgets)
+        else:
+            for widget in widgets:
+                widget.draw() if profiler is None else profiler.draw(widget)
 
-        # Conversion is used to prevent errors when widgets are added/removed during iteration a.k.a safe iteration
-        widgets = list(WidgetHandler._widgets)
+        if profiler is not None:
+            profiler.endFrame(widgets)
 
-        for widget in widgets[::-1]:
-            if not blocked or not widget.contains(*Mouse.getMousePos()):
-                widget.listen(events)
+        if WidgetHandler._latencyTracker is not None:
+            WidgetHandler._latencyTracker.endFrame()
 
-            # Ensure widgets covered by others are not affected (widgets created later)
-            if widget.contains(*Mouse.getMousePos()):  # TODO: Unless 'transparent'
-                blocked = True
+        return rects
+
+    @staticmethod
+    def _drawDirty(widgets: list[WidgetBase]) -> list[pygame.Rect]:
+        """Redraw only the areas covered by widgets that have changed
+
+        :return: The areas of the screen that were updated
+        """
+        screen = pygame.display.get_surface()
+        profiler = WidgetHandler._profiler
+        rects = WidgetHandler._invalidRects
+        WidgetHandler._invalidRects = []
 
         for widget in widgets:
-            widget.draw()
+            if widget.isDirty():
+                widget.markClean()
+
+                drawn = WidgetHandler._drawnRects.pop(id(widget), None)
+                if drawn is not None:
+                    rects.append(drawn[1])
+
+                if widget.isVisible():
+                    rect = widget.getSubtreeRect()
+                    rects.append(rect)
+                    WidgetHandler._drawnRects[id(widget)] = (
+                        drawn[0] if drawn is not None else
+                        weakref.ref(widget, lambda _, key=id(widget): WidgetHandler._forgetDrawn(key)),
+                        rect
+                    )
+
+        if not rects:
+            return []
+
+        rects = WidgetHandler._mergeRects([rect.clip(screen.get_rect()) for rect in rects])
+        visible = [widget for widget in widgets if id(widget) in WidgetHandler._drawnRects]
+
+        for rect in rects:
+            if isinstance(WidgetHandler._background, pygame.Surface):
+                screen.blit(WidgetHandler._background, rect, rect)
+            else:
+                screen.fill(WidgetHandler._background, rect)
+
+            for widget in visible:
+                if WidgetHandler._drawnRects[id(widget)][1].colliderect(rect):
+                    offsetX, offsetY = widget.win.get_abs_offset()
+                    clip = widget.win.get_clip()
+                    widget.win.set_clip(rect.move(-offsetX, -offsetY))
+                    widget.draw() if profiler is None else profiler.draw(widget)
+                    widget.win.set_clip(clip)
+
+        return rects
+
+    @staticmethod
+    def _mergeRects(rects: list[pygame.Rect]) -> list[pygame.Rect]:
+        """Combine overlapping rectangles so no area is drawn twice"""
+        merged = []
+        for rect in rects:
+            if not rect.width or not rect.height:
+                continue
+
+            i = 0
+            while i < len(merged):
+                if rect.colliderect(merged[i]):
+                    rect = rect.union(merged.pop(i))
+                    i = 0
+                else:
+                    i += 1
+
+            merged.append(rect)
+
+        return merged
+
+    @staticmethod
+    def _forgetDrawn(key: int) -> None:
+        drawn = WidgetHandler._drawnRects.pop(key, None)
+        if drawn is not None:
+            WidgetHandler._invalidRects.append(drawn[1])
+
+    @staticmethod
+    def enableDirtyRendering(background: pygame.Surface | tuple = (255, 255, 255)) -> None:
+        """Only redraw widgets that have changed. pygame_widgets.update then returns the changed areas, to be
+        passed to pygame.display.update. The window should not be cleared every frame in this mode
+
+        :param background: Colour or surface restored behind widgets before they are redrawn
+        """
+        WidgetHandler._background = background
+        WidgetHandler.invalidate()
+
+    @staticmethod
+    def disableDirtyRendering() -> None:
+        WidgetHandler._background = None
+        WidgetHandler._drawnRects.clear()
+        WidgetHandler._invalidRects.clear()
+
+    @staticmethod
+    def invalidate(rect: pygame.Rect | None = None) -> None:
+        """Force an area to be redrawn on the next update, e.g. after drawing over the widgets
+
+        :param rect: Area of the screen to redraw, or None for the whole screen
+        """
+        if rect is None:
+            rect = pygame.display.get_surface().get_rect()
+
+        WidgetHandler._invalidRects.append(pygame.Rect(rect))
+
+    @staticmethod
+    def enableProfiling(profiler) -> None:
+        """Time the listen and draw calls of every widget and count the contains calls made each frame
+
+        :param profiler: Records the timings, see pygame_widgets.profiler.Profiler
+        """
+        WidgetHandler._profiler = profiler
+
+    @staticmethod
+    def disableProfiling() -> None:
+        WidgetHandler._profiler = None
+
+    @staticmethod
+    def getProfiler():
+        return WidgetHandler._profiler
+
+    @staticmethod
+    def enableLatencyTracking(tracker) -> None:
+        """Measure the latency from input to the callbacks of widgets and to the frames showing their response
+
+        :param tracker: Records the latencies, see pygame_widgets.profiler.LatencyTracker
+        """
+        WidgetHandler.disableLatencyTracking()
+
+        WidgetHandler._latencyTracker = tracker
+        tracker.active = True
+        for widget in WidgetHandler._widgets:
+            tracker.track(widget)
+
+    @staticmethod
+    def disableLatencyTracking() -> None:
+        """Stop measuring and restore the callbacks of the widgets"""
+        if WidgetHandler._latencyTracker is not None:
+            WidgetHandler._latencyTracker.active = False
+            WidgetHandler._latencyTracker.restore()
+
+        WidgetHandler._latencyTracker = None
+
+    @staticmethod
+    def _refreshSpatialIndex() -> None:
+        for widget in list(WidgetHandler._staleWidgets):
+            if widget in WidgetHandler._widgets:
+                WidgetHandler._spatialIndex.insert(widget, widget.getSubtreeRect())
+
+        WidgetHandler._staleWidgets.clear()
+
+    @staticmethod
+    def _getCandidates(x, y) -> list[WidgetBase]:
+        """Widgets containing the point, topmost first"""
+        WidgetHandler._refreshSpatialIndex()
+
+        nearby = WidgetHandler._spatialIndex.query(x, y)
+        if WidgetHandler._profiler is not None:
+            WidgetHandler._profiler.countContains(len(nearby))
+
+        candidates = [widget for widget in nearby if widget.contains(x, y)]
+        candidates.sort(key=lambda widget: widget._zIndex, reverse=True)
+        return candidates
+
+    @staticmethod
+    def getTopmostWidget(x, y) -> WidgetBase | None:
+        """Get the highest widget in the z-order containing the point
+
+        :param x: X-coordinate in screen coordinates
+        :param y: Y-coordinate in screen coordinates
+        :return: The widget, or None if no widget contains the point
+        """
+        if WidgetHandler._spatialIndex is not None:
+            candidates = WidgetHandler._getCandidates(x, y)
+            return candidates[0] if candidates else None
+
+        for widget in reversed(WidgetHandler._widgets.snapshot()):
+            if widget.contains(x, y):
+                return widget
+
+        return None
+
+    @staticmethod
+    def enableSpatialIndex(cellSize: int = 128) -> None:
+        """Use a uniform grid to find the widgets under the mouse instead of checking every widget. Only the
+        contains checks are saved, every widget is still listened to and drawn each frame
+
+        :param cellSize: Width and height of each grid cell in pixels
+        """
+        WidgetHandler._spatialIndex = SpatialGrid(cellSize)
+        WidgetHandler._staleWidgets = weakref.WeakSet(WidgetHandler._widgets)
+
+    @staticmethod
+    def disableSpatialIndex() -> None:
+        WidgetHandler._spatialIndex = None
+        WidgetHandler._staleWidgets.clear()
+
+    @staticmethod
+    def updateWidget(widget: WidgetBase) -> None:
+        """Notify the handler that the bounds of a widget have changed. Re-indexing is deferred until needed"""
+        widget.markDirty()
+        widget.updateOffset()
+
+        if WidgetHandler._spatialIndex is not None:
+            WidgetHandler._staleWidgets.add(widget.getRoot())
 
     @staticmethod
     def addWidget(widget: WidgetBase) -> None:
         if widget not in WidgetHandler._widgets:
             WidgetHandler._widgets.add(widget)
-            WidgetHandler.moveToTop(widget)
+            WidgetHandler.updateWidget(widget)
+
+            if WidgetHandler._latencyTracker is not None:
+                WidgetHandler._latencyTracker.track(widget)
 
     @staticmethod
     def removeWidget(widget: WidgetBase) -> None:
         try:
             WidgetHandler._widgets.remove(widget)
-        except ValueError:
+        except KeyError:
             print(f'Error: Tried to remove {widget} when {widget} not in WidgetHandler.')
 
+        if WidgetHandler._spatialIndex is not None:
+            WidgetHandler._staleWidgets.discard(widget)
+            WidgetHandler._spatialIndex.remove(widget)
+
+        WidgetHandler._forgetDrawn(id(widget))
+
     @staticmethod
     def moveToTop(widget: WidgetBase):
         try:
-            WidgetHandler._widgets.move_to_end(widget)
+            if WidgetHandler._widgets.moveToTop(widget):
+                widget.markDirty()
         except KeyError:
             print(f'Error: Tried to move {widget} to top when {widget} not in WidgetHandler.')
 
     @staticmethod
     def moveToBottom(widget: WidgetBase):
         try:
-            WidgetHandler._widgets.move_to_start(widget)
+            if WidgetHandler._widgets.moveToBottom(widget):
+                widget.markDirty()
         except KeyError:
             print(f'Error: Tried to move {widget} to bottom when {widget} not in WidgetHandler.')
 
+    @staticmethod
+    def moveAllToTop(widgets) -> None:
+        """Move widgets above all others, keeping their order. Faster than moving each in turn"""
+        for widget in WidgetHandler._widgets.moveAllToTop(widgets):
+            widget.markDirty()
+
+    @staticmethod
+    def moveAllToBottom(widgets) -> None:
+        """Move widgets beneath all others, keeping their order. Faster than moving each in turn"""
+        for widget in WidgetHandler._widgets.moveAllToBottom(widgets):
+            widget.markDirty()
+
     @staticmethod
     def getWidgets() -> [WidgetBase]:
         return WidgetHandler._widgets